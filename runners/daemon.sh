@@ -0,0 +1,5 @@
+#!/bin/bash
+cd /home/opc/availability
+source /home/opc/availability/venv/bin/activate
+cd /home/opc/availability/scripts
+/usr/bin/python3 daemon.py
\ No newline at end of file
@@ -4,6 +4,7 @@ sys.path.append("../")
 
 import logging
 from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
 from google.cloud import bigquery
 
 import src
@@ -29,97 +30,136 @@ def setup_logging():
     )
 
 
-def init_runner() -> src.runner.Runner:
-    secrets = src.utils.load_json(script_config.secrets_path)
-
-    apify_proxy_password = secrets.get("APIFY_PROXY_PASSWORD")[
-        script_config.proxy_password_position
-    ]
-
-    proxy_config = src.models.ProxyConfig(
-        password=apify_proxy_password,
-    )
-
-    checker = src.checker.AsyncAvailabilityChecker(
-        proxy_config=proxy_config,
-    )
-
+def init_config(secrets: Dict) -> src.models.Config:
     bq_client, pinecone_index, _ = src.config.init_clients(
         secrets=secrets,
     )
 
-    config = src.config.init_config(
+    return src.config.init_config(
         bq_client=bq_client,
         pinecone_index=pinecone_index,
         is_women_alpha=script_config.is_women_alpha,
         sort_by_date_alpha=script_config.sort_by_date_alpha,
         catalog_score_weights=script_config.catalog_score_weights,
+        prioritize=script_config.prioritize,
+        stale_after_hours=script_config.stale_after_hours,
+        bqstorage_client=init_bqstorage_client(secrets),
     )
 
-    return src.runner.Runner(config=config, checker=checker)
 
+def init_bqstorage_client(secrets: Dict) -> Optional[Any]:
+    if not script_config.use_arrow:
+        return None
 
-def load_from_bigquery(
-    runner: src.runner.Runner,
-) -> bigquery.table.RowIterator:
+    return src.bigquery.init_bqstorage_client(secrets.get("GCP_CREDENTIALS"))
+
+
+def build_query(config: src.models.Config) -> str:
     query_kwargs = {
         "n": script_config.num_items,
-        "is_women": runner.config.is_women,
-        "sort_by_date": runner.config.sort_by_date,
-        "catalog_score": runner.config.catalog_score,
+        "is_women": config.is_women,
+        "sort_by_date": config.sort_by_date,
+        "catalog_score": config.catalog_score,
+        "prioritize": config.prioritize,
+        "stale_after_hours": config.stale_after_hours,
+        "shard": script_config.shard,
+        "num_shards": script_config.num_shards,
     }
 
-    query = src.bigquery.query_items(**query_kwargs)
+    return src.bigquery.query_items(**query_kwargs)
 
-    return src.bigquery.run_query(
-        client=runner.config.bq_client, query=query, to_list=False
-    )
 
+async def load_from_bigquery(
+    runner: src.runner.Runner,
+) -> bigquery.table.RowIterator:
+    query = build_query(runner.config)
 
-async def main():
-    setup_logging()
+    return await runner.clients.bigquery.run_query(query, to_list=False)
+
+
+def load_record_batches_from_bigquery(runner: src.runner.Runner) -> Iterator[Any]:
+    query = build_query(runner.config)
+
+    return src.bigquery.iter_record_batches(
+        client=runner.config.bq_client,
+        query=query,
+        bqstorage_client=runner.config.bqstorage_client,
+    )
 
-    runner = init_runner()
-    logging.info(f"Config: {runner.config}")
 
-    iterator = load_from_bigquery(runner)
-    loader = src.models.PineconeDataLoader()
+async def main(runner: src.runner.Runner):
+    logging.info(f"Config: {runner.config}")
 
-    use_proxy = False
     n, n_sold, success_rate_list = 0, 0, []
 
-    for row in iterator:
-        entry = src.models.PineconeEntry.from_dict(dict(row))
-        loader.add(entry)
+    def on_batch(result: src.models.CheckResult, updated: bool) -> None:
+        nonlocal n, n_sold
 
-        if loader.total_rows % script_config.run_every == 0:
-            n += 1
-            use_proxy = src.utils.use_proxy_func(
-                use_proxy, script_config.use_proxy_alpha
-            )
+        n += 1
+        n_sold += result.n_sold
+        success_rate_list.append(result.success_rate)
+        average_success_rate = sum(success_rate_list) / len(success_rate_list)
 
-            n_sold_batch, updated, success_rate = await runner.run_async(
-                loader, use_proxy
-            )
+        logging.info(
+            f"Batch #{n} | "
+            f"Proxied: {result.n_proxied}/{result.n} | "
+            f"Updated: {updated} | "
+            f"Sold: {result.n_sold} | "
+            f"Failed: {len(result.failed)} | "
+            f"Total sold: {n_sold} | "
+            f"Success rate: {result.success_rate:.2f} | "
+            f"Average success rate: {average_success_rate:.2f}"
+        )
 
-            success_rate_list.append(success_rate)
-            average_success_rate = sum(success_rate_list) / len(success_rate_list)
-            n_sold += n_sold_batch
+        limiter_stats = runner.checker.limiter_stats
 
-            loader = src.models.PineconeDataLoader()
+        if limiter_stats:
+            logging.info(
+                f"Window: {limiter_stats['window']} | "
+                f"Requests/s: {limiter_stats['requests_per_second']:.2f} | "
+                f"Backoff rate: {limiter_stats['backoff_rate']:.2f}"
+            )
 
+        probe_stats = runner.checker.probe_stats
+
+        if probe_stats:
             logging.info(
-                f"Batch #{n} | "
-                f"Proxy: {use_proxy} | "
-                f"Updated: {updated} | "
-                f"Sold: {n_sold_batch} | "
-                f"Total sold: {n_sold} | "
-                f"Success rate: {success_rate:.2f} | "
-                f"Average success rate: {average_success_rate:.2f}"
+                f"Probed: {probe_stats['probed']} | "
+                f"Answered: {probe_stats['answered']} | "
+                f"Fallback: {probe_stats['fallback']}"
             )
 
+    pipeline = src.pipeline.Pipeline(
+        runner=runner,
+        batch_size=script_config.run_every,
+        use_proxy_alpha=script_config.use_proxy_alpha,
+        on_batch=on_batch,
+    )
+
+    if script_config.use_arrow:
+        record_batches = load_record_batches_from_bigquery(runner)
+        await pipeline.run_record_batches(record_batches)
+    else:
+        iterator = await load_from_bigquery(runner)
+        await pipeline.run(iterator)
+
+
+async def run():
+    setup_logging()
+
+    secrets = src.utils.load_json(script_config.secrets_path)
+    runner = src.config.init_runner(
+        script_config=script_config, config=init_config(secrets), secrets=secrets
+    )
+
+    async with runner.checker:
+        try:
+            await main(runner)
+        finally:
+            await runner.close()
+
 
 if __name__ == "__main__":
     import asyncio
 
-    asyncio.run(main())
+    asyncio.run(run())
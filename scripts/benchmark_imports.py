@@ -0,0 +1,77 @@
+import sys
+
+sys.path.append("../")
+
+import os, logging, statistics, subprocess
+from typing import Optional
+
+import src
+
+
+config_dict = src.utils.load_yaml("config.yaml")
+benchmark_config = config_dict["BENCHMARK"]
+
+ROOT_DIR = os.path.abspath("../")
+
+
+def measure_import(module: str) -> Optional[float]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+
+    if process.returncode != 0:
+        logging.error(f"Failed to import {module}: {process.stderr.strip()[-500:]}")
+        return None
+
+    for line in reversed(process.stderr.splitlines()):
+        parts = line.split("|")
+
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+
+    return None
+
+
+def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    n_runs = benchmark_config.get("IMPORT_RUNS", 5)
+    over_budget = []
+
+    for module, budget in benchmark_config["IMPORT_BUDGETS_MS"].items():
+        timings = [measure_import(module) for _ in range(n_runs)]
+        timings = [timing for timing in timings if timing is not None]
+
+        if not timings:
+            over_budget.append(module)
+            continue
+
+        median = statistics.median(timings)
+
+        if median > budget:
+            over_budget.append(module)
+
+        logging.info(
+            f"Module: {module} | "
+            f"Median: {median:.1f}ms | "
+            f"Min: {min(timings):.1f}ms | "
+            f"Budget: {budget}ms | "
+            f"{'OK' if median <= budget else 'OVER BUDGET'}"
+        )
+
+    if over_budget:
+        logging.error(f"Over import budget: {over_budget}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
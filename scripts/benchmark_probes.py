@@ -0,0 +1,61 @@
+import sys
+
+sys.path.append("../")
+
+import logging
+
+import src
+
+
+config_dict = src.utils.load_yaml("config.yaml")
+benchmark_config = config_dict["BENCHMARK"]
+
+
+async def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    responses = src.replay.load_responses(benchmark_config["RECORDED_RESPONSES_PATH"])
+    items = src.replay.recorded_items(responses)
+    logging.info(f"Loaded {len(responses)} responses for {len(items)} items")
+
+    baseline = None
+
+    for strategy in benchmark_config["STRATEGIES"]:
+        checker = src.checker.CHECKER_STRATEGIES[strategy](
+            max_attempts=1, retry_with_proxy=False
+        )
+
+        stats, statuses = await src.replay.benchmark(
+            checker, responses, items, baseline
+        )
+
+        if baseline is None:
+            baseline = {
+                status.item_id: status.is_available for status in statuses if status.ok
+            }
+
+        for name, pass_stats in stats.items():
+            logging.info(
+                f"Strategy: {strategy} | "
+                f"Pass: {name} | "
+                f"Items: {pass_stats['n']} | "
+                f"Ok: {pass_stats['n_ok']} | "
+                f"Requests/item: {pass_stats['requests_per_item']:.2f} | "
+                f"Probed: {pass_stats.get('n_probed', 0)} | "
+                f"Answered: {pass_stats.get('n_answered', 0)} | "
+                f"Fallback: {pass_stats.get('n_fallback', 0)} | "
+                f"Misses: {pass_stats['n_misses']} | "
+                f"Bytes: {pass_stats['n_bytes']} | "
+                f"Elapsed: {pass_stats['elapsed']:.2f}s | "
+                f"Agreement: {pass_stats.get('agreement', 1.0):.2f}"
+            )
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    asyncio.run(main())
@@ -0,0 +1,199 @@
+import sys
+
+sys.path.append("../")
+
+import logging, asyncio, signal
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import AsyncIterator, Dict
+
+import src
+import all as all_script
+import from_interactions as interactions_script
+
+
+config_dict = src.utils.load_yaml("config.yaml")
+daemon_config = config_dict["DAEMON"]
+
+saved_script_config = src.models.ScriptConfig.from_config_dict(
+    config_dict=config_dict,
+    config_key="SAVED",
+)
+
+
+def setup_logging():
+    today = datetime.now().strftime("%Y%m%d")
+    log_file = f"{all_script.script_config.log_dir}/daemon_{today}.log"
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
+    )
+
+
+def init_config_factory(secrets: Dict):
+    bq_client, pinecone_index, supabase_client = src.config.init_clients(
+        secrets=secrets,
+        with_supabase=True,
+    )
+    bqstorage_client = all_script.init_bqstorage_client(secrets)
+
+    def build_config(name: str) -> src.models.Config:
+        if name == "all":
+            return src.config.init_config(
+                bq_client=bq_client,
+                pinecone_index=pinecone_index,
+                is_women_alpha=all_script.script_config.is_women_alpha,
+                sort_by_date_alpha=all_script.script_config.sort_by_date_alpha,
+                catalog_score_weights=all_script.script_config.catalog_score_weights,
+                prioritize=all_script.script_config.prioritize,
+                stale_after_hours=all_script.script_config.stale_after_hours,
+                bqstorage_client=bqstorage_client,
+            )
+
+        if name == "interactions":
+            return src.config.init_config(
+                bq_client=bq_client,
+                pinecone_index=pinecone_index,
+                from_interactions=True,
+                sort_by_date_alpha=interactions_script.script_config.sort_by_date_alpha,
+            )
+
+        if name == "saved":
+            return src.config.init_config(
+                bq_client=bq_client,
+                pinecone_index=pinecone_index,
+                supabase_client=supabase_client,
+                from_saved=True,
+                saved_ascending_alpha=config_dict["SAVED"].get("ASCENDING_ALPHA", 0.0),
+            )
+
+        raise ValueError(f"Unknown job: {name}")
+
+    return build_config
+
+
+async def iter_saved_rows(runner: src.runner.Runner) -> AsyncIterator[Dict]:
+    page_size = daemon_config.get("SAVED_PAGE_SIZE", saved_script_config.num_items)
+    seen_ids = src.dedup.SeenIds()
+    n, after = 0, None
+
+    while n < saved_script_config.num_items:
+        entries, after = await runner.clients.supabase.get_saved_page(
+            n=page_size,
+            after=after,
+            ascending=runner.config.ascending_saved,
+        )
+        entries = [entry for entry in entries if seen_ids.add(entry.vinted_id)]
+
+        if not entries:
+            break
+
+        for entry in entries[: saved_script_config.num_items - n]:
+            yield entry._asdict()
+
+        n += len(entries)
+
+
+async def run_saved(runner: src.runner.Runner) -> None:
+    logging.info(f"Config: {runner.config}")
+
+    n_sold = 0
+
+    def on_batch(result: src.models.CheckResult, updated: bool) -> None:
+        nonlocal n_sold
+
+        n_sold += result.n_sold
+
+        logging.info(
+            f"Saved | "
+            f"Updated: {updated} | "
+            f"Sold: {result.n_sold} | "
+            f"Total sold: {n_sold} | "
+            f"Success rate: {result.success_rate:.2f}"
+        )
+
+        probe_stats = runner.checker.probe_stats
+
+        if probe_stats:
+            logging.info(
+                f"Probed: {probe_stats['probed']} | "
+                f"Answered: {probe_stats['answered']} | "
+                f"Fallback: {probe_stats['fallback']}"
+            )
+
+    pipeline = src.pipeline.Pipeline(
+        runner=runner,
+        batch_size=saved_script_config.run_every or all_script.script_config.run_every,
+        use_proxy_alpha=saved_script_config.use_proxy_alpha,
+        on_batch=on_batch,
+    )
+
+    await pipeline.run(iter_saved_rows(runner))
+
+
+def init_runner(
+    name: str,
+    config: src.models.Config,
+    secrets: Dict,
+    clients: src.clients.AsyncClients,
+) -> src.runner.Runner:
+    script_configs = {
+        "all": all_script.script_config,
+        "interactions": interactions_script.script_config,
+        "saved": saved_script_config,
+    }
+
+    if name not in script_configs:
+        raise ValueError(f"Unknown job: {name}")
+
+    return src.config.init_runner(
+        script_config=script_configs[name].for_job(name),
+        config=config,
+        secrets=secrets,
+        clients=clients.share(),
+    )
+
+
+async def run():
+    setup_logging()
+
+    secrets = src.utils.load_json(all_script.script_config.secrets_path)
+    config_factory = await asyncio.to_thread(init_config_factory, secrets)
+    jobs = [src.models.ScheduledJob.from_dict(job) for job in daemon_config["JOBS"]]
+    clients = src.clients.AsyncClients()
+    runners = {
+        job.name: init_runner(job.name, config_factory(job.name), secrets, clients)
+        for job in jobs
+    }
+
+    daemon = src.daemon.Daemon(
+        runners=runners,
+        jobs=jobs,
+        handlers={
+            "all": all_script.main,
+            "interactions": interactions_script.main,
+            "saved": run_saved,
+        },
+        config_factory=config_factory,
+    )
+
+    loop = asyncio.get_running_loop()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, daemon.stop)
+
+    async with AsyncExitStack() as stack:
+        stack.callback(clients.close)
+
+        for runner in runners.values():
+            await stack.enter_async_context(runner.checker)
+            stack.push_async_callback(runner.close)
+
+        await daemon.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -4,7 +4,7 @@ sys.path.append("../")
 
 import logging
 from datetime import datetime
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import src
 
@@ -29,26 +29,12 @@ def setup_logging():
     )
 
 
-def init_runner() -> src.runner.Runner:
-    secrets = src.utils.load_json(script_config.secrets_path)
-
-    apify_proxy_password = secrets.get("APIFY_PROXY_PASSWORD")[
-        script_config.proxy_password_position
-    ]
-
-    proxy_config = src.models.ProxyConfig(
-        password=apify_proxy_password,
-    )
-
-    checker = src.checker.AsyncAvailabilityChecker(
-        proxy_config=proxy_config,
-    )
-
+def init_config(secrets: Dict) -> src.models.Config:
     bq_client, pinecone_index, _ = src.config.init_clients(
         secrets=secrets,
     )
 
-    config = src.config.init_config(
+    return src.config.init_config(
         bq_client=bq_client,
         pinecone_index=pinecone_index,
         from_interactions=True,
@@ -56,54 +42,43 @@ def init_runner() -> src.runner.Runner:
         # days_lookback=script_config.days_lookback,
     )
 
-    return src.runner.Runner(config=config, checker=checker)
 
-
-def load_data(runner: src.runner.Runner) -> Tuple[List[str], List[str]]:
+async def load_data(runner: src.runner.Runner) -> Tuple[List[str], List[str]]:
     query = src.bigquery.query_interaction_items(
         n=script_config.num_items,
         shuffle=True,
+        shard=script_config.shard,
+        num_shards=script_config.num_shards,
     )
 
-    loader = src.bigquery.run_query(
-        client=runner.config.bq_client, query=query, to_list=False
-    )
+    rows = await runner.clients.bigquery.run_query(query)
 
     point_ids, namespaces = [], []
 
-    for row in loader:
-        point_ids.append(row.point_id)
-        namespaces.append(row.category_type)
+    for row in rows:
+        point_ids.append(row["point_id"])
+        namespaces.append(row["category_type"])
 
     return point_ids, namespaces
 
 
-async def main():
-    setup_logging()
-
-    runner = init_runner()
+async def main(runner: src.runner.Runner):
     logging.info(f"Config: {runner.config}")
 
     use_proxy = False
     n, n_sold, success_rate_list = 0, 0, []
-    point_ids, namespaces = load_data(runner)
-
-    for point_id, namespace in zip(point_ids, namespaces):
-        if namespace is None:
-            continue
-
-        loader = src.pinecone.get_neighbors(
-            index=runner.config.pinecone_index,
-            namespace=namespace,
-            point_id=point_id,
-            n=script_config.num_neighbors,
-            days_lookback=runner.config.days_lookback,
-        )
+    point_ids, namespaces = await load_data(runner)
+    seen_ids = src.dedup.SeenIds()
+    batch_size = script_config.run_every or script_config.num_neighbors
+
+    async def run_batch(loader: src.models.PineconeDataLoader) -> None:
+        nonlocal use_proxy, n, n_sold
 
         try:
-            use_proxy = src.utils.use_proxy_func(
-                use_proxy, script_config.use_proxy_alpha
-            )
+            if runner.checker.proxy_pool is None:
+                use_proxy = src.utils.use_proxy_func(
+                    use_proxy, script_config.use_proxy_alpha
+                )
 
             n_sold_batch, updated, success_rate = await runner.run_async(
                 loader, use_proxy
@@ -120,16 +95,72 @@ async def main():
 
         logging.info(
             f"Batch #{n} | "
-            f"Proxy: {use_proxy} | "
+            f"Proxy: {'pool' if runner.checker.proxy_pool else use_proxy} | "
             f"Updated: {updated} | "
             f"Sold: {n_sold_batch} | "
+            f"Failed: {len(runner.failed)} | "
             f"Total sold: {n_sold} | "
             f"Success rate: {success_rate:.2f} | "
-            f"Average success rate: {average_success_rate:.2f}"
+            f"Average success rate: {average_success_rate:.2f} | "
+            f"Unique: {len(seen_ids)} | "
+            f"Duplicates: {seen_ids.n_duplicates}"
         )
 
+        limiter_stats = runner.checker.limiter_stats
+
+        if limiter_stats:
+            logging.info(
+                f"Window: {limiter_stats['window']} | "
+                f"Requests/s: {limiter_stats['requests_per_second']:.2f} | "
+                f"Backoff rate: {limiter_stats['backoff_rate']:.2f}"
+            )
+
+        probe_stats = runner.checker.probe_stats
+
+        if probe_stats:
+            logging.info(
+                f"Probed: {probe_stats['probed']} | "
+                f"Answered: {probe_stats['answered']} | "
+                f"Fallback: {probe_stats['fallback']}"
+            )
+
+    pending = src.models.PineconeDataLoader()
+
+    neighbors = runner.clients.pinecone.iter_neighbors(
+        queries=zip(point_ids, namespaces),
+        n=script_config.num_neighbors,
+        days_lookback=runner.config.days_lookback,
+        max_parallel=script_config.query_parallelism,
+    )
+
+    async for loader in neighbors:
+        for entry in seen_ids.filter(loader):
+            pending.add(entry)
+
+        if len(pending) >= batch_size:
+            await run_batch(pending)
+            pending = src.models.PineconeDataLoader()
+
+    if len(pending) > 0:
+        await run_batch(pending)
+
+
+async def run():
+    setup_logging()
+
+    secrets = src.utils.load_json(script_config.secrets_path)
+    runner = src.config.init_runner(
+        script_config=script_config, config=init_config(secrets), secrets=secrets
+    )
+
+    async with runner.checker:
+        try:
+            await main(runner)
+        finally:
+            await runner.close()
+
 
 if __name__ == "__main__":
     import asyncio
 
-    asyncio.run(main())
+    asyncio.run(run())
@@ -0,0 +1,120 @@
+import sys
+
+sys.path.append("../")
+
+import logging, asyncio
+from dataclasses import fields
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict
+
+import src
+from all import script_config, init_config, build_query
+
+
+CLIENT_FIELDS = ("bq_client", "pinecone_index", "supabase_client", "bqstorage_client")
+
+
+def setup_logging(name: str):
+    today = datetime.now().strftime("%Y%m%d")
+    log_file = f"{script_config.log_dir}/{name}_{today}.log"
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(processName)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
+    )
+
+
+def config_values(config: src.models.Config) -> Dict[str, Any]:
+    return {
+        field.name: getattr(config, field.name)
+        for field in fields(config)
+        if field.name not in CLIENT_FIELDS
+    }
+
+
+def init_worker_config(config_kwargs: Dict[str, Any]) -> src.models.Config:
+    secrets = src.utils.load_json(script_config.secrets_path)
+    bq_client, pinecone_index, _ = src.config.init_clients(secrets=secrets)
+
+    return src.models.Config(
+        bq_client=bq_client, pinecone_index=pinecone_index, **config_kwargs
+    )
+
+
+def worker(config_kwargs: Dict[str, Any], worker_id: int, task_queue, stats_queue):
+    setup_logging(f"all_worker{worker_id}")
+    asyncio.run(run_worker(config_kwargs, worker_id, task_queue, stats_queue))
+
+
+async def run_worker(
+    config_kwargs: Dict[str, Any], worker_id: int, task_queue, stats_queue
+):
+    runner = src.config.init_runner(
+        script_config=script_config.for_worker(worker_id),
+        config=init_worker_config(config_kwargs),
+        create_tables=False,
+    )
+
+    def on_batch(result: src.models.CheckResult, updated: bool) -> None:
+        stats = src.models.WorkerStats.from_result(result, updated)
+        stats_queue.put((worker_id, stats))
+
+    pipeline = src.pipeline.Pipeline(
+        runner=runner,
+        batch_size=script_config.run_every,
+        use_proxy_alpha=script_config.use_proxy_alpha,
+        on_batch=on_batch,
+    )
+
+    async with runner.checker:
+        try:
+            await pipeline.run(src.supervisor.iter_queue(task_queue))
+        finally:
+            await runner.close()
+
+
+def main():
+    setup_logging("supervisor")
+
+    secrets = src.utils.load_json(script_config.secrets_path)
+    config = init_config(secrets)
+    logging.info(f"Config: {config} | Workers: {script_config.num_workers}")
+
+    src.config.create_check_table(config, script_config)
+
+    rows = src.bigquery.run_query(
+        client=config.bq_client, query=build_query(config), to_list=False
+    )
+
+    def on_stats(worker_id: int, stats: src.models.WorkerStats) -> None:
+        total = supervisor.total
+
+        logging.info(
+            f"Worker #{worker_id} | "
+            f"Sold: {stats.n_sold} | "
+            f"Success rate: {stats.success_rate:.2f} | "
+            f"Total checked: {total.n} | "
+            f"Total sold: {total.n_sold} | "
+            f"Average success rate: {total.success_rate:.2f}"
+        )
+
+    supervisor = src.supervisor.Supervisor(
+        target=partial(worker, config_values(config)),
+        num_workers=script_config.num_workers,
+        chunk_size=script_config.worker_chunk_size,
+        on_stats=on_stats,
+    )
+
+    total = supervisor.run(rows)
+
+    for worker_id, stats in sorted(supervisor.stats.items()):
+        logging.info(f"Worker #{worker_id} | {stats.to_dict()}")
+
+    logging.info(f"Total | {total.to_dict()}")
+
+
+if __name__ == "__main__":
+    main()
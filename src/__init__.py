@@ -1,10 +1,39 @@
-from . import (
-    bigquery,
-    enums,
-    pinecone,
-    models,
-    runner,
-    config,
-    utils,
-    supabase,
-)
+import importlib
+
+
+__all__ = [
+    "bigquery",
+    "enums",
+    "pinecone",
+    "models",
+    "runner",
+    "checker",
+    "config",
+    "utils",
+    "supabase",
+    "limiter",
+    "cookies",
+    "identity",
+    "proxy",
+    "pipeline",
+    "buffer",
+    "journal",
+    "dedup",
+    "replay",
+    "supervisor",
+    "daemon",
+    "clients",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,20 +1,28 @@
-from typing import List, Dict, Union, Optional
+from __future__ import annotations
 
-from google.oauth2 import service_account
-from google.cloud import bigquery
+from typing import TYPE_CHECKING, List, Dict, Union, Optional, Iterator, Any
 
-from .models import SoldItem
+from .models import SoldItem, ItemCheck
 from .enums import *
 
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+
+
+def init_credentials(credentials_dict: Dict) -> Any:
+    from google.oauth2 import service_account
 
-def init_bigquery_client(credentials_dict: Dict) -> bigquery.Client:
     credentials_dict["private_key"] = credentials_dict["private_key"].replace(
         "\\n", "\n"
     )
 
-    credentials = service_account.Credentials.from_service_account_info(
-        credentials_dict
-    )
+    return service_account.Credentials.from_service_account_info(credentials_dict)
+
+
+def init_bigquery_client(credentials_dict: Dict) -> bigquery.Client:
+    from google.cloud import bigquery
+
+    credentials = init_credentials(credentials_dict)
 
     return bigquery.Client(
         credentials=credentials, project=credentials_dict["project_id"]
@@ -28,6 +36,27 @@ def insert_rows_json(client: bigquery.Client, item_ids: List[str]) -> bool:
         errors = client.insert_rows_json(
             table=f"{VINTED_DATASET_ID}.{SOLD_TABLE_ID}",
             json_rows=rows,
+            row_ids=[row["vinted_id"] for row in rows],
+        )
+
+        return not errors
+
+    except Exception as e:
+        print(e)
+        return False
+
+
+def insert_checks(client: bigquery.Client, checks: List[ItemCheck]) -> bool:
+    try:
+        rows = [check.to_dict() for check in checks]
+
+        if not rows:
+            return True
+
+        errors = client.insert_rows_json(
+            table=f"{VINTED_DATASET_ID}.{CHECK_TABLE_ID}",
+            json_rows=rows,
+            row_ids=[f"{row['vinted_id']}:{row['checked_at']}" for row in rows],
         )
 
         return not errors
@@ -40,6 +69,8 @@ def insert_rows_json(client: bigquery.Client, item_ids: List[str]) -> bool:
 def run_query(
     client: bigquery.Client, query: str, to_list: bool = True
 ) -> Union[List[Dict], bigquery.table.RowIterator]:
+    from google.cloud import bigquery
+
     job_config = bigquery.QueryJobConfig(use_query_cache=True)
     query_job = client.query(query, job_config=job_config)
     results = query_job.result()
@@ -50,24 +81,67 @@ def run_query(
         return results
 
 
+def iter_record_batches(
+    client: bigquery.Client, query: str, bqstorage_client: Optional[Any] = None
+) -> Iterator[Any]:
+    from google.cloud import bigquery
+
+    job_config = bigquery.QueryJobConfig(use_query_cache=True)
+    query_job = client.query(query, job_config=job_config)
+    query_job.result()
+    results = client.list_rows(query_job.destination)
+
+    if hasattr(results, "to_arrow_iterable"):
+        yield from results.to_arrow_iterable(bqstorage_client=bqstorage_client)
+    else:
+        table = results.to_arrow(
+            bqstorage_client=bqstorage_client, progress_bar_type=None
+        )
+        yield from table.to_batches()
+
+
+def init_bqstorage_client(credentials_dict: Dict) -> Optional[Any]:
+    try:
+        from google.cloud import bigquery_storage
+
+        return bigquery_storage.BigQueryReadClient(
+            credentials=init_credentials(credentials_dict)
+        )
+
+    except Exception as e:
+        print(e)
+        return None
+
+
 def query_items(
     sort_by_date: bool = False,
     item_ids: Optional[List[str]] = None,
     n: Optional[int] = None,
     is_women: Optional[bool] = None,
     catalog_score: Optional[CatalogScore] = None,
+    prioritize: bool = False,
+    stale_after_hours: Optional[int] = None,
+    shard: Optional[int] = None,
+    num_shards: Optional[int] = None,
 ) -> str:
     where_prefix = "\nAND"
 
     query = f"""
-SELECT item.id, p.point_id, item.vinted_id, item.url, item.category_type, c.score
+{_priority_ctes() if prioritize else ""}
+SELECT item.id, p.point_id, item.vinted_id, item.url, item.category_type, c.score{_priority_column() if prioritize else ""}
 FROM `{PROJECT_ID}.{VINTED_DATASET_ID}.{ITEM_ACTIVE_TABLE_ID}` item
 INNER JOIN `{PROJECT_ID}.{VINTED_DATASET_ID}.{PINECONE_TABLE_ID}` AS p ON item.id = p.item_id
 INNER JOIN `{PROJECT_ID}.{VINTED_DATASET_ID}.{CATALOG_TABLE_ID}` AS c USING (catalog_id)
-LEFT JOIN `{PROJECT_ID}.{VINTED_DATASET_ID}.{SOLD_TABLE_ID}` AS s USING (vinted_id)
+LEFT JOIN `{PROJECT_ID}.{VINTED_DATASET_ID}.{SOLD_TABLE_ID}` AS s USING (vinted_id){_priority_joins() if prioritize else ""}{_recent_checks_join(stale_after_hours) if stale_after_hours is not None else ""}
 WHERE s.vinted_id IS NULL
     """
 
+    if stale_after_hours is not None:
+        query += f"{where_prefix} rc.vinted_id IS NULL"
+
+    if shard is not None:
+        query += f"{where_prefix} {shard_predicate('item.vinted_id', shard, num_shards)}"
+
     if catalog_score is not None:
         query += f"{where_prefix} c.score = {catalog_score}"
 
@@ -78,9 +152,11 @@ WHERE s.vinted_id IS NULL
         item_ids_str = ", ".join(f"'{item_id}'" for item_id in item_ids)
         query += f"{where_prefix} id IN ({item_ids_str})"
 
-    if sort_by_date:
+    if prioritize:
+        query += f"\nORDER BY priority * (1 - {PRIORITY_JITTER} * RAND()) DESC"
+    elif stale_after_hours is None and sort_by_date:
         query += f"\nORDER BY item.created_at DESC"
-    else:
+    elif stale_after_hours is None:
         query += f"\nORDER BY RAND()"
 
     if n:
@@ -89,14 +165,84 @@ WHERE s.vinted_id IS NULL
     return query
 
 
+def _priority_ctes() -> str:
+    return f"""
+WITH
+SoldRate AS (
+SELECT i.category_type, COUNT(sold.vinted_id) / COUNT(*) AS sold_rate
+FROM `{PROJECT_ID}.{VINTED_DATASET_ID}.{ITEM_TABLE_ID}` AS i
+LEFT JOIN `{PROJECT_ID}.{VINTED_DATASET_ID}.{SOLD_TABLE_ID}` AS sold USING (vinted_id)
+WHERE DATE(i.created_at) >= DATE_SUB(CURRENT_DATE(), INTERVAL {PRIORITY_SOLD_RATE_DAYS} DAY)
+GROUP BY i.category_type)
+, Interactions AS (
+SELECT item_id FROM `{PROJECT_ID}.{PROD_DATASET_ID}.{CLICK_OUT_TABLE_ID}`
+UNION DISTINCT
+SELECT item_id FROM `{PROJECT_ID}.{PROD_DATASET_ID}.{SAVED_TABLE_ID}`)
+    """
+
+
+def _priority_column() -> str:
+    catalog_weights = " ".join(
+        f"WHEN {score} THEN {weight}"
+        for score, weight in PRIORITY_CATALOG_WEIGHTS.items()
+    )
+
+    return f""",
+(IFNULL(r.sold_rate, 0) + {PRIORITY_SOLD_RATE_PRIOR})
+* (CASE c.score {catalog_weights} ELSE {min(PRIORITY_CATALOG_WEIGHTS.values())} END)
+* POW(0.5, TIMESTAMP_DIFF(CURRENT_TIMESTAMP(), TIMESTAMP(item.created_at), HOUR) / {24 * PRIORITY_AGE_HALF_LIFE_DAYS})
+* IF(x.item_id IS NULL, 1, {1 + PRIORITY_INTERACTION_BOOST})
+* IF(lc.last_checked_at IS NULL, 1, 1 - POW(0.5, TIMESTAMP_DIFF(CURRENT_TIMESTAMP(), lc.last_checked_at, HOUR) / {PRIORITY_CHECK_HALF_LIFE_HOURS})) AS priority"""
+
+
+def _priority_joins() -> str:
+    return f"""
+LEFT JOIN SoldRate AS r ON item.category_type = r.category_type
+LEFT JOIN Interactions AS x ON item.id = x.item_id
+LEFT JOIN (
+SELECT vinted_id, MAX(checked_at) AS last_checked_at
+FROM `{PROJECT_ID}.{VINTED_DATASET_ID}.{CHECK_TABLE_ID}`
+WHERE checked_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {PRIORITY_CHECK_LOOKBACK_HOURS} HOUR)
+GROUP BY vinted_id) AS lc USING (vinted_id)"""
+
+
+def _recent_checks_join(hours: int) -> str:
+    return f"""
+LEFT JOIN (
+SELECT DISTINCT vinted_id
+FROM `{PROJECT_ID}.{VINTED_DATASET_ID}.{CHECK_TABLE_ID}`
+WHERE checked_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {hours} HOUR)) AS rc USING (vinted_id)"""
+
+
+def query_create_check_table() -> str:
+    return f"""
+CREATE TABLE IF NOT EXISTS `{PROJECT_ID}.{VINTED_DATASET_ID}.{CHECK_TABLE_ID}` (
+vinted_id STRING,
+status_code INT64,
+checked_at TIMESTAMP
+)
+PARTITION BY DATE(checked_at)
+CLUSTER BY vinted_id
+OPTIONS (partition_expiration_days = {CHECK_LOOKBACK_DAYS})
+    """
+
+
 def query_vector_ids(
-    n: Optional[int] = None, index: Optional[int] = None, shuffle: bool = False
+    n: Optional[int] = None,
+    index: Optional[int] = None,
+    shuffle: bool = False,
+    shard: Optional[int] = None,
+    num_shards: Optional[int] = None,
 ) -> str:
     query = f"""
 SELECT DISTINCT point_id
 FROM `{PROJECT_ID}.{VINTED_DATASET_ID}.{PINECONE_TABLE_ID}`
+WHERE TRUE
     """
 
+    if shard is not None:
+        query += f"\nAND {shard_predicate('point_id', shard, num_shards)}"
+
     if shuffle and index is None:
         query += "\nORDER BY RAND()"
 
@@ -110,7 +256,11 @@ FROM `{PROJECT_ID}.{VINTED_DATASET_ID}.{PINECONE_TABLE_ID}`
 
 
 def query_interaction_items(
-    n: Optional[int] = None, index: Optional[int] = None, shuffle: bool = False
+    n: Optional[int] = None,
+    index: Optional[int] = None,
+    shuffle: bool = False,
+    shard: Optional[int] = None,
+    num_shards: Optional[int] = None,
 ) -> str:
     category_types_str = ", ".join([f"'{category_type}'" for category_type in CATEGORY_TYPES])
     
@@ -137,6 +287,9 @@ FROM Data
 WHERE rn = 1
     """
 
+    if shard is not None:
+        query += f"\nAND {shard_predicate('point_id', shard, num_shards)}"
+
     if shuffle:
         query += "\nORDER BY RAND()"
 
@@ -149,6 +302,15 @@ WHERE rn = 1
     return query
 
 
+def shard_predicate(column: str, shard: int, num_shards: Optional[int]) -> str:
+    if not num_shards or not 0 <= shard < num_shards:
+        raise ValueError(f"Invalid shard {shard} for {num_shards} shards")
+
+    return (
+        f"MOD(ABS(FARM_FINGERPRINT(CAST({column} AS STRING))), {num_shards}) = {shard}"
+    )
+
+
 def query_pinecone_points(item_ids: List[str]) -> str:
     item_ids_str = ", ".join([f"'{item_id}'" for item_id in item_ids])
 
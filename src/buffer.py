@@ -0,0 +1,124 @@
+from typing import Optional
+
+import os, json, time
+
+from .models import CheckResult
+from .enums import (
+    SOLD_BUFFER_MAX_SIZE,
+    SOLD_BUFFER_MAX_AGE,
+    SOLD_BUFFER_RETRY_DELAY,
+    SOLD_BUFFER_MAX_RETRY_DELAY,
+    MAX_RETRIES,
+)
+
+
+class SoldBuffer:
+    def __init__(
+        self,
+        max_size: int = SOLD_BUFFER_MAX_SIZE,
+        max_age: float = SOLD_BUFFER_MAX_AGE,
+        wal_path: Optional[str] = None,
+        alert_after_failures: int = MAX_RETRIES,
+        retry_delay: float = SOLD_BUFFER_RETRY_DELAY,
+        max_retry_delay: float = SOLD_BUFFER_MAX_RETRY_DELAY,
+    ):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.wal_path = wal_path
+        self.alert_after_failures = alert_after_failures
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.n_flush_failures = 0
+        self._pending = CheckResult()
+        self._created_at: Optional[float] = None
+        self._retry_at: Optional[float] = None
+
+        if self.wal_path:
+            self._replay()
+
+    def __len__(self) -> int:
+        return self._pending.n_sold
+
+    def add(self, result: CheckResult) -> None:
+        if result.n_sold == 0:
+            return
+
+        if self.wal_path:
+            self._append(result)
+
+        self._pending.merge(CheckResult.from_sold_dict(result.to_sold_dict()))
+
+        if self._created_at is None:
+            self._created_at = time.monotonic()
+
+    def pending(self) -> CheckResult:
+        return self._pending
+
+    def age(self) -> float:
+        if self._created_at is None:
+            return 0.0
+
+        return time.monotonic() - self._created_at
+
+    def time_until_flush(self) -> Optional[float]:
+        if len(self) == 0:
+            return None
+
+        if self._retry_at is not None:
+            return max(0.0, self._retry_at - time.monotonic())
+
+        return max(0.0, self.max_age - self.age())
+
+    def should_flush(self) -> bool:
+        if len(self) == 0:
+            return False
+
+        if self._retry_at is not None:
+            return time.monotonic() >= self._retry_at
+
+        return len(self) >= self.max_size or self.age() >= self.max_age
+
+    @property
+    def should_alert(self) -> bool:
+        return self.n_flush_failures >= self.alert_after_failures
+
+    def defer(self) -> float:
+        self.n_flush_failures += 1
+        delay = min(
+            self.max_retry_delay,
+            self.retry_delay * 2 ** (self.n_flush_failures - 1),
+        )
+        self._retry_at = time.monotonic() + delay
+
+        return delay
+
+    def clear(self) -> None:
+        self._pending = CheckResult()
+        self._created_at = None
+        self._retry_at = None
+        self.n_flush_failures = 0
+
+        if self.wal_path and os.path.exists(self.wal_path):
+            open(self.wal_path, "w").close()
+
+    def _append(self, result: CheckResult) -> None:
+        with open(self.wal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result.to_sold_dict()) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _replay(self) -> None:
+        if not os.path.exists(self.wal_path):
+            return
+
+        with open(self.wal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = CheckResult.from_sold_dict(json.loads(line))
+                except (json.JSONDecodeError, AttributeError):
+                    continue
+
+                self._pending.merge(result)
+
+        if len(self) > 0:
+            self._created_at = time.monotonic() - self.max_age
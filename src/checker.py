@@ -1,12 +1,39 @@
-from typing import Dict, List, Optional
-from abc import ABC, abstractmethod
-
-import logging, asyncio, aiohttp
-import requests
-from tqdm import tqdm
+from __future__ import annotations
 
-from src.models import ProxyConfig, VintedItemStatus
-from src.enums import MAX_RETRIES, INITIAL_SLEEP_TIME, MAX_SLEEP_TIME
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+import logging, asyncio, random, time
+
+from src.models import ProxyConfig, VintedItemStatus, CheckerIdentity
+from src.limiter import TokenBucket, AdaptiveLimiter
+from src.cookies import CookieCache
+from src.identity import IdentityPool, IdentityStrategy
+from src.proxy import ProxyPool
+from src.replay import RecordingSession
+from src.utils import load_json, save_json
+from src.enums import (
+    MAX_RETRIES,
+    INITIAL_SLEEP_TIME,
+    MAX_SLEEP_TIME,
+    REQUEST_TIMEOUT,
+    CONNECTOR_LIMIT,
+    CONNECTOR_LIMIT_PER_HOST,
+    KEEPALIVE_TIMEOUT,
+    DNS_CACHE_TTL,
+    MAX_CONCURRENCY,
+    ADAPTIVE_INITIAL_CONCURRENCY,
+    CHECK_MAX_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    COOKIE_MIN_REFRESH_INTERVAL,
+    ETAG_CACHE_SIZE,
+    IDENTITY_SESSION_PREFIX,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
 
 
 class BaseAvailabilityChecker(ABC):
@@ -44,87 +71,429 @@ class BaseAvailabilityChecker(ABC):
 
 
 class AsyncAvailabilityChecker(BaseAvailabilityChecker):
+    def __init__(
+        self,
+        proxy_config: Optional[ProxyConfig] = None,
+        connector_limit: int = CONNECTOR_LIMIT,
+        connector_limit_per_host: int = CONNECTOR_LIMIT_PER_HOST,
+        keepalive_timeout: int = KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = DNS_CACHE_TTL,
+        max_concurrency: Optional[int] = MAX_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+        adaptive_concurrency: bool = False,
+        max_attempts: int = CHECK_MAX_ATTEMPTS,
+        retry_with_proxy: bool = True,
+        retry_base_delay: float = RETRY_BASE_DELAY,
+        retry_max_delay: float = RETRY_MAX_DELAY,
+        cookie_cache: Optional[CookieCache] = None,
+        num_identities: int = 1,
+        identity_strategy: IdentityStrategy = "least_loaded",
+        proxy_pool: Optional[ProxyPool] = None,
+        record_path: Optional[str] = None,
+        session_prefix: str = IDENTITY_SESSION_PREFIX,
+    ):
+        super().__init__(proxy_config)
+        self.connector_limit = connector_limit
+        self.connector_limit_per_host = connector_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max(1, max_attempts)
+        self.retry_with_proxy = retry_with_proxy
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.cookie_cache = cookie_cache
+        self.proxy_pool = proxy_pool
+        self.identity_pool = IdentityPool.from_proxy_config(
+            proxy_config,
+            n=num_identities,
+            session_prefix=session_prefix,
+            strategy=identity_strategy,
+            on_rekey=self._on_identity_rekeyed,
+            proxy_pool=proxy_pool,
+        )
+        self._cookie_refresh_tasks: Dict[str, asyncio.Task] = {}
+        self.record_path = record_path
+        self.probe_stats: Optional[Dict[str, int]] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._urls: Dict[str, str] = {}
+        self._semaphore, self._adaptive_limiter = None, None
+
+        if max_concurrency and adaptive_concurrency:
+            self._adaptive_limiter = AdaptiveLimiter(
+                max_limit=max_concurrency,
+                initial_limit=min(max_concurrency, ADAPTIVE_INITIAL_CONCURRENCY),
+            )
+        elif max_concurrency:
+            self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        self._rate_limiter = (
+            TokenBucket(rate=requests_per_second) if requests_per_second else None
+        )
+
+    async def __aenter__(self) -> "AsyncAvailabilityChecker":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.connector_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
+
+            if self.record_path:
+                self._session = RecordingSession(self._session, self.record_path)
+
+        return self._session
+
+    def set_session(self, session) -> None:
+        self._session = session
+
+    async def close(self) -> None:
+        for task in self._cookie_refresh_tasks.values():
+            task.cancel()
+
+        self._cookie_refresh_tasks = {}
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+
     async def run(
-        self, item_ids: List[str], use_proxy: bool = False
+        self,
+        item_ids: List[str],
+        use_proxy: bool = False,
+        urls: Optional[List[Optional[str]]] = None,
     ) -> List[VintedItemStatus]:
         if not item_ids:
             return []
 
-        self._cookies = await self.get_cookies()
-        coroutines = [self._run(item_id, use_proxy) for item_id in item_ids]
-        results = await asyncio.gather(*coroutines)
+        if urls:
+            self._urls.update(
+                (item_id, url) for item_id, url in zip(item_ids, urls) if url
+            )
+
+        try:
+            await self._load_cookies()
+            coroutines = [
+                self._run_with_retries(item_id, use_proxy) for item_id in item_ids
+            ]
+            results = await asyncio.gather(*coroutines)
+
+        finally:
+            for item_id in item_ids:
+                self._urls.pop(item_id, None)
 
         return results
 
+    @property
+    def limiter_stats(self) -> Optional[Dict[str, float]]:
+        if self._adaptive_limiter is None:
+            return None
+
+        return self._adaptive_limiter.stats
+
+    async def _load_cookies(self) -> None:
+        identities = self.identity_pool.active or self.identity_pool.identities
+        coroutines = [self._load_identity_cookies(identity) for identity in identities]
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+
+        if len(errors) == len(results):
+            raise errors[0]
+
+        for identity, result in zip(identities, results):
+            if isinstance(result, Exception):
+                self.identity_pool.retire(identity)
+
+    async def _load_identity_cookies(self, identity: CheckerIdentity) -> None:
+        cookies = self.cookie_cache.get(identity.key) if self.cookie_cache else None
+
+        if cookies is None:
+            await self._ensure_cookies(identity, force=True)
+            return
+
+        identity.cookies = cookies
+
+        if self.cookie_cache.needs_refresh(identity.key):
+            self._schedule_cookie_refresh(identity)
+
+    async def _ensure_cookies(
+        self, identity: CheckerIdentity, force: bool = False
+    ) -> None:
+        task = self._cookie_refresh_tasks.get(identity.key)
+
+        if task is None or (task.done() and (force or identity.cookies is None)):
+            task = self._schedule_cookie_refresh(identity)
+
+        try:
+            await asyncio.shield(task)
+
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+
+            await self._ensure_cookies(identity, force=True)
+
+    async def _refresh_cookies(self, identity: CheckerIdentity) -> Dict:
+        key = identity.key
+        cookies = await self.get_cookies(
+            proxy_config=identity.proxy_config, direct=identity.proxy_config is None
+        )
+
+        if identity.key != key:
+            return cookies
+
+        identity.cookies = cookies
+
+        if self.cookie_cache is not None:
+            self.cookie_cache.set(key, cookies)
+
+        return cookies
+
+    def _schedule_cookie_refresh(self, identity: CheckerIdentity) -> asyncio.Task:
+        task = self._cookie_refresh_tasks.get(identity.key)
+
+        if task is not None and not task.done():
+            return task
+
+        task = asyncio.create_task(self._refresh_cookies(identity))
+        task.add_done_callback(self._on_cookie_refresh_done)
+        self._cookie_refresh_tasks[identity.key] = task
+
+        return task
+
+    def _on_cookie_refresh_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            self.logger.error(f"Error refreshing cookies: {task.exception()}")
+
+    def _on_identity_rekeyed(self, identity: CheckerIdentity, old_key: str) -> None:
+        task = self._cookie_refresh_tasks.pop(old_key, None)
+
+        if task is not None and not task.done():
+            task.cancel()
+
+        if self.cookie_cache is not None:
+            self.cookie_cache.invalidate(old_key)
+
+    def _on_unauthorized(self, identity: CheckerIdentity) -> None:
+        if self.cookie_cache is None:
+            return
+
+        age = self.cookie_cache.age(identity.key)
+
+        if age is None or age >= COOKIE_MIN_REFRESH_INTERVAL:
+            self._schedule_cookie_refresh(identity)
+
+    async def _run_with_retries(
+        self, item_id: str, use_proxy: bool = False
+    ) -> VintedItemStatus:
+        for attempt in range(1, self.max_attempts + 1):
+            status = await self._run_limited(item_id, use_proxy)
+            status.attempts = attempt
+
+            if status.ok or attempt == self.max_attempts:
+                return status
+
+            await asyncio.sleep(self._retry_delay(attempt))
+
+            if self.retry_with_proxy and self.proxy_config:
+                use_proxy = True
+
+        return status
+
+    def _retry_delay(self, attempt: int) -> float:
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+
+        return random.uniform(delay / 2, delay)
+
+    async def _run_limited(
+        self, item_id: str, use_proxy: bool = False
+    ) -> VintedItemStatus:
+        if self._adaptive_limiter is not None:
+            return await self._run_adaptive(item_id, use_proxy)
+
+        if self._semaphore is None:
+            return await self._run_throttled(item_id, use_proxy)
+
+        async with self._semaphore:
+            return await self._run_throttled(item_id, use_proxy)
+
+    async def _run_adaptive(
+        self, item_id: str, use_proxy: bool = False
+    ) -> VintedItemStatus:
+        await self._adaptive_limiter.acquire()
+        status_code = 505
+
+        try:
+            status = await self._run_throttled(item_id, use_proxy)
+            status_code = status.status_code
+
+            return status
+
+        finally:
+            await self._adaptive_limiter.release(status_code)
+
+    async def _run_throttled(
+        self, item_id: str, use_proxy: bool = False
+    ) -> VintedItemStatus:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        retry_in = self.identity_pool.retry_in()
+
+        if retry_in > 0:
+            await asyncio.sleep(retry_in)
+
+        identity = self.identity_pool.acquire(require_proxy=use_proxy)
+        proxy = identity.endpoint
+        status_code = 505
+
+        try:
+            if identity.cookies is None:
+                await self._ensure_cookies(identity)
+
+            start = time.monotonic()
+            status = await self._run(item_id, use_proxy, identity)
+            status_code = status.status_code
+            status.proxy = self._proxy_name(identity, use_proxy)
+
+            if proxy is not None:
+                self.proxy_pool.record(proxy, status.ok, time.monotonic() - start)
+
+            return status
+
+        except Exception as e:
+            return VintedItemStatus(
+                item_id=item_id,
+                is_available=False,
+                status_code=status_code,
+                error=str(e),
+            )
+
+        finally:
+            self.identity_pool.release(identity, status_code)
+
     async def get_cookies(
-        self, retry_count: int = 0, sleep_time: int = INITIAL_SLEEP_TIME
+        self,
+        retry_count: int = 0,
+        sleep_time: int = INITIAL_SLEEP_TIME,
+        proxy_config: Optional[ProxyConfig] = None,
+        direct: bool = False,
     ) -> Dict:
         if retry_count >= MAX_RETRIES:
             raise Exception(f"Failed to get cookies after {MAX_RETRIES} retries")
 
         headers = {**self.BASE_HEADERS, "Referer": self.BASE_URL}
+        proxy_config = None if direct else proxy_config or self.proxy_config
 
         kwargs = {
             "headers": headers,
             "allow_redirects": True,
-            "timeout": 30,
-            "proxy": self.proxy_config.url if self.proxy_config else None,
+            "proxy": proxy_config.url if proxy_config else None,
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.BASE_URL, **kwargs) as response:
-                    if not response.ok:
-                        await asyncio.sleep(min(sleep_time, MAX_SLEEP_TIME))
+            session = self._get_session()
 
-                        return await self.get_cookies(retry_count + 1, sleep_time * 2)
+            async with session.get(self.BASE_URL, **kwargs) as response:
+                if not response.ok:
+                    await asyncio.sleep(min(sleep_time, MAX_SLEEP_TIME))
 
-                    return {
-                        cookie.key: cookie.value for cookie in response.cookies.values()
-                    }
+                    return await self.get_cookies(
+                        retry_count + 1, sleep_time * 2, proxy_config, direct
+                    )
+
+                return {
+                    cookie.key: cookie.value for cookie in response.cookies.values()
+                }
 
         except Exception as e:
             self.logger.error(
                 f"Error getting cookies (attempt {retry_count + 1}/{MAX_RETRIES}): {e}"
             )
             await asyncio.sleep(min(sleep_time, MAX_SLEEP_TIME))
-            return await self.get_cookies(retry_count + 1, sleep_time * 2)
+            return await self.get_cookies(
+                retry_count + 1, sleep_time * 2, proxy_config, direct
+            )
 
-    async def _run(self, item_id: str, use_proxy: bool = False) -> VintedItemStatus:
-        headers = {**self.BASE_HEADERS, "Referer": self.BASE_URL}
-        url = self.BASE_API_URL.format(item_id)
+    def _proxy_name(self, identity: CheckerIdentity, use_proxy: bool) -> Optional[str]:
+        if not identity.proxy_url:
+            return None
 
+        if identity.endpoint is not None:
+            return identity.endpoint.name
+
+        return "default" if use_proxy else None
+
+    def _request_kwargs(
+        self,
+        use_proxy: bool,
+        identity: CheckerIdentity,
+        headers: Optional[Dict] = None,
+        allow_redirects: bool = True,
+    ) -> Dict:
         kwargs = {
-            "headers": headers,
-            "cookies": self._cookies,
-            "allow_redirects": True,
-            "timeout": 30,
+            "headers": headers or {**self.BASE_HEADERS, "Referer": self.BASE_URL},
+            "cookies": identity.cookies,
+            "allow_redirects": allow_redirects,
         }
 
-        if use_proxy and self.proxy_config:
-            kwargs["proxy"] = self.proxy_config.url
+        if identity.proxy_url and (use_proxy or identity.endpoint is not None):
+            kwargs["proxy"] = identity.proxy_url
+
+        return kwargs
+
+    async def _run(
+        self,
+        item_id: str,
+        use_proxy: bool = False,
+        identity: Optional[CheckerIdentity] = None,
+    ) -> VintedItemStatus:
+        identity = identity or self.identity_pool.identities[0]
+        url = self.BASE_API_URL.format(item_id)
+        kwargs = self._request_kwargs(use_proxy, identity)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, **kwargs) as response:
-                    status_code = response.status
-
-                    try:
-                        data = await response.json()
-
-                        return VintedItemStatus(
-                            item_id=item_id,
-                            is_available=self.check_is_available(data),
-                            status_code=status_code,
-                        )
-
-                    except Exception as e:
-                        return VintedItemStatus(
-                            item_id=item_id,
-                            is_available=False,
-                            status_code=status_code,
-                            error=f"Failed to parse response: {str(e)}",
-                        )
+            session = self._get_session()
+
+            async with session.get(url, **kwargs) as response:
+                status_code = response.status
+
+                if status_code in (401, 403):
+                    self._on_unauthorized(identity)
+
+                try:
+                    data = await response.json()
+
+                    return VintedItemStatus(
+                        item_id=item_id,
+                        is_available=self.check_is_available(data),
+                        status_code=status_code,
+                    )
+
+                except Exception as e:
+                    return VintedItemStatus(
+                        item_id=item_id,
+                        is_available=False,
+                        status_code=status_code,
+                        error=f"Failed to parse response: {str(e)}",
+                    )
 
         except Exception as e:
             return VintedItemStatus(
@@ -135,6 +504,125 @@ class AsyncAvailabilityChecker(BaseAvailabilityChecker):
             )
 
 
+class ProbeAvailabilityChecker(AsyncAvailabilityChecker):
+    PROBE_HEADERS = {
+        **BaseAvailabilityChecker.BASE_HEADERS,
+        "Accept": "text/html,application/xhtml+xml",
+    }
+    UNAVAILABLE_STATUS_CODES = (404, 410)
+
+    def __init__(
+        self,
+        *args,
+        max_etags: int = ETAG_CACHE_SIZE,
+        etags_path: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.max_etags = max_etags
+        self.etags_path = etags_path
+        self._etags: "OrderedDict[str, str]" = OrderedDict()
+        self.probe_stats = {"probed": 0, "answered": 0, "fallback": 0}
+
+        if self.etags_path:
+            self.seed_etags(load_json(self.etags_path) or {})
+
+    def seed_etags(self, etags: Dict[str, str]) -> None:
+        for item_id, etag in etags.items():
+            self._remember_etag(item_id, etag)
+
+    async def close(self) -> None:
+        if self.etags_path:
+            await asyncio.to_thread(save_json, dict(self._etags), self.etags_path)
+
+        await super().close()
+
+    async def _run(
+        self,
+        item_id: str,
+        use_proxy: bool = False,
+        identity: Optional[CheckerIdentity] = None,
+    ) -> VintedItemStatus:
+        identity = identity or self.identity_pool.identities[0]
+        url, etag = self._urls.get(item_id), None
+
+        if url:
+            status, etag = await self._probe(item_id, url, use_proxy, identity)
+
+            if status is not None:
+                self.probe_stats["answered"] += 1
+                return status
+
+        self.probe_stats["fallback"] += 1
+        status = await super()._run(item_id, use_proxy, identity)
+
+        if etag and status.status_code == 200 and status.is_available:
+            self._remember_etag(item_id, etag)
+        elif status.ok:
+            self._etags.pop(item_id, None)
+
+        return status
+
+    async def _probe(
+        self,
+        item_id: str,
+        url: str,
+        use_proxy: bool,
+        identity: CheckerIdentity,
+    ) -> Tuple[Optional[VintedItemStatus], Optional[str]]:
+        headers = {**self.PROBE_HEADERS, "Referer": self.BASE_URL}
+        known_etag = self._etags.get(item_id)
+
+        if known_etag:
+            headers["If-None-Match"] = known_etag
+
+        kwargs = self._request_kwargs(
+            use_proxy, identity, headers=headers, allow_redirects=False
+        )
+        self.probe_stats["probed"] += 1
+
+        try:
+            session = self._get_session()
+
+            async with session.head(url, **kwargs) as response:
+                status_code = response.status
+                etag = response.headers.get("ETag")
+
+        except Exception as e:
+            self.logger.error(f"Error probing item {item_id}: {e}")
+            return None, None
+
+        if status_code == 304 and known_etag:
+            self._etags.move_to_end(item_id)
+            return VintedItemStatus(item_id=item_id, status_code=200), known_etag
+
+        if status_code in self.UNAVAILABLE_STATUS_CODES:
+            self._etags.pop(item_id, None)
+
+            return (
+                VintedItemStatus(item_id=item_id, is_available=False, status_code=404),
+                None,
+            )
+
+        if status_code == 200:
+            return None, etag
+
+        return None, None
+
+    def _remember_etag(self, item_id: str, etag: str) -> None:
+        self._etags[item_id] = etag
+        self._etags.move_to_end(item_id)
+
+        while len(self._etags) > self.max_etags:
+            self._etags.popitem(last=False)
+
+
+CHECKER_STRATEGIES = {
+    "details": AsyncAvailabilityChecker,
+    "head": ProbeAvailabilityChecker,
+}
+
+
 class AvailabilityChecker(BaseAvailabilityChecker):
     def run(self, item_ids: List[str]) -> List[VintedItemStatus]:
         if not item_ids:
@@ -143,6 +631,8 @@ class AvailabilityChecker(BaseAvailabilityChecker):
         if not self._cookies:
             self._cookies = self.get_cookies()
 
+        from tqdm import tqdm
+
         n, n_success = 0, 0
         results = []
         loop = tqdm(iterable=item_ids, total=len(item_ids))
@@ -158,6 +648,8 @@ class AvailabilityChecker(BaseAvailabilityChecker):
         return results
 
     def get_cookies(self) -> Dict:
+        import requests
+
         headers = {**self.BASE_HEADERS, "Referer": self.BASE_URL}
 
         kwargs = {
@@ -185,6 +677,8 @@ class AvailabilityChecker(BaseAvailabilityChecker):
             raise
 
     def _run(self, item_id: str) -> VintedItemStatus:
+        import requests
+
         headers = {**self.BASE_HEADERS, "Referer": self.BASE_URL}
         url = self.BASE_API_URL.format(item_id)
 
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import asyncio
+from copy import copy
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+from .models import Config, ItemCheck, PineconeDataLoader, PineconeEntry
+from .bigquery import run_query, insert_rows_json, insert_checks, query_pinecone_points
+from .pinecone import delete_points_by_namespace_async, iter_neighbors
+from .supabase import (
+    saved_items_query,
+    parse_saved_items,
+    parse_saved_cursor,
+    unavailable_query,
+)
+from .enums import (
+    CLIENT_MAX_WORKERS,
+    BIGQUERY_MAX_CONCURRENCY,
+    BIGQUERY_TIMEOUT,
+    PINECONE_MAX_CONCURRENCY,
+    PINECONE_TIMEOUT,
+    SUPABASE_MAX_CONCURRENCY,
+    SUPABASE_TIMEOUT,
+    DELETE_PARALLELISM,
+    QUERY_PARALLELISM,
+)
+
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+    from pinecone.data.index import Index
+
+
+class AsyncBackend:
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.executor = executor
+        self.semaphore = semaphore
+        self.timeout = timeout
+
+    async def call(self, func: Callable, *args, **kwargs) -> Any:
+        return await self.call_with_timeout(func, self.timeout, *args, **kwargs)
+
+    async def call_with_timeout(
+        self, func: Callable, timeout: Optional[float], *args, **kwargs
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+
+        return await self._limited(
+            lambda: loop.run_in_executor(self.executor, partial(func, *args, **kwargs)),
+            timeout,
+        )
+
+    async def _limited(
+        self, factory: Callable[[], Awaitable[Any]], timeout: Optional[float]
+    ) -> Any:
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+
+        try:
+            future = asyncio.ensure_future(factory())
+
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(self._on_done)
+
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def _on_done(self, future: asyncio.Future) -> None:
+        self._release()
+
+        if not future.cancelled():
+            future.exception()
+
+    def _release(self) -> None:
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+
+class AsyncBigQuery(AsyncBackend):
+    def __init__(self, client: bigquery.Client, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = client
+
+    async def run_query(
+        self, query: str, to_list: bool = True, timeout: Optional[float] = None
+    ) -> Any:
+        return await self.call_with_timeout(
+            run_query, timeout, client=self.client, query=query, to_list=to_list
+        )
+
+    async def query_point_ids(self, item_ids: List[str]) -> List[str]:
+        try:
+            rows = await self.run_query(
+                query_pinecone_points(item_ids=item_ids), timeout=self.timeout
+            )
+
+        except Exception as e:
+            print(e)
+            return []
+
+        return [row["point_id"] for row in rows]
+
+    async def insert_rows_json(self, item_ids: List[str]) -> bool:
+        return await self.call_with_timeout(
+            insert_rows_json, None, client=self.client, item_ids=item_ids
+        )
+
+    async def insert_checks(self, checks: List[ItemCheck]) -> bool:
+        return await self.call_with_timeout(
+            insert_checks, None, client=self.client, checks=checks
+        )
+
+
+class AsyncPinecone(AsyncBackend):
+    def __init__(self, index: Index, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.index = index
+
+    async def delete_by_namespace(
+        self,
+        point_ids: Dict[str, List[str]],
+        max_parallel: int = DELETE_PARALLELISM,
+    ) -> Dict[str, Tuple[float, List[str]]]:
+        return await delete_points_by_namespace_async(
+            index=self.index,
+            point_ids=point_ids,
+            max_parallel=max_parallel,
+            call=self.call,
+        )
+
+    def iter_neighbors(
+        self,
+        queries: Iterable[Tuple[str, str]],
+        n: int,
+        days_lookback: Optional[int] = None,
+        max_parallel: int = QUERY_PARALLELISM,
+    ) -> AsyncIterator[PineconeDataLoader]:
+        return iter_neighbors(
+            index=self.index,
+            queries=queries,
+            n=n,
+            days_lookback=days_lookback,
+            max_parallel=max_parallel,
+            call=self.call,
+        )
+
+
+class AsyncSupabase(AsyncBackend):
+    def __init__(self, client: Any, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = client
+
+    async def get_saved_page(
+        self, n: int, after: Optional[str] = None, ascending: bool = False
+    ) -> Tuple[List[PineconeEntry], Optional[str]]:
+        try:
+            query = saved_items_query(
+                self.client, n=n, ascending=ascending, after=after
+            )
+            response = await self.call(query.execute)
+
+            return parse_saved_items(response), parse_saved_cursor(response)
+
+        except Exception as e:
+            print(e)
+            return [], None
+
+    async def set_items_unavailable(self, item_ids: List[str]) -> bool:
+        try:
+            await self.call(unavailable_query(self.client, item_ids).execute)
+            return True
+
+        except Exception as e:
+            print(e)
+            return False
+
+
+class AsyncClients:
+    def __init__(
+        self,
+        max_workers: int = CLIENT_MAX_WORKERS,
+        bigquery_max_concurrency: int = BIGQUERY_MAX_CONCURRENCY,
+        bigquery_timeout: float = BIGQUERY_TIMEOUT,
+        pinecone_max_concurrency: int = PINECONE_MAX_CONCURRENCY,
+        pinecone_timeout: float = PINECONE_TIMEOUT,
+        supabase_max_concurrency: int = SUPABASE_MAX_CONCURRENCY,
+        supabase_timeout: float = SUPABASE_TIMEOUT,
+    ):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="clients"
+        )
+        self.bigquery_timeout = bigquery_timeout
+        self.pinecone_timeout = pinecone_timeout
+        self.supabase_timeout = supabase_timeout
+        self.owns_executor = True
+        self._semaphores = {
+            "bigquery": asyncio.Semaphore(bigquery_max_concurrency),
+            "pinecone": asyncio.Semaphore(pinecone_max_concurrency),
+            "supabase": asyncio.Semaphore(supabase_max_concurrency),
+        }
+        self.config: Optional[Config] = None
+        self.bigquery: Optional[AsyncBigQuery] = None
+        self.pinecone: Optional[AsyncPinecone] = None
+        self.supabase: Optional[AsyncSupabase] = None
+
+    def bind(self, config: Config) -> "AsyncClients":
+        self.config = config
+
+        self.bigquery = AsyncBigQuery(
+            config.bq_client,
+            self.executor,
+            self._semaphores["bigquery"],
+            self.bigquery_timeout,
+        )
+
+        self.pinecone = AsyncPinecone(
+            config.pinecone_index,
+            self.executor,
+            self._semaphores["pinecone"],
+            self.pinecone_timeout,
+        )
+
+        self.supabase = None
+
+        if config.supabase_client:
+            self.supabase = AsyncSupabase(
+                config.supabase_client,
+                self.executor,
+                self._semaphores["supabase"],
+                self.supabase_timeout,
+            )
+
+        return self
+
+    def share(self) -> "AsyncClients":
+        shared = copy(self)
+        shared.owns_executor = False
+        shared.config = None
+        shared.bigquery, shared.pinecone, shared.supabase = None, None, None
+
+        return shared
+
+    def close(self) -> None:
+        if self.owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
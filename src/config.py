@@ -1,21 +1,33 @@
-from typing import Dict, Tuple, Optional, List
+from __future__ import annotations
 
-import random
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Optional, List
 
-from google.cloud import bigquery
-from pinecone import Pinecone
-from supabase import Client as SupabaseClient
+import random
 
-from .models import Config
-from .bigquery import init_bigquery_client
+from .models import Config, ScriptConfig, ProxyConfig
+from .bigquery import init_bigquery_client, query_create_check_table, run_query
 from .supabase import init_supabase_client
+from .checker import CHECKER_STRATEGIES, AsyncAvailabilityChecker
+from .proxy import ProxyPool
+from .cookies import CookieCache
+from .journal import CheckJournal
+from .buffer import SoldBuffer
+from .clients import AsyncClients
+from .runner import Runner
 from .enums import PINECONE_INDEX_NAME, CATALOG_SCORE_VALUES
-from .utils import select_weighted_value
+from .utils import select_weighted_value, load_json
+
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+    from pinecone import Pinecone
+    from supabase import Client as SupabaseClient
 
 
 def init_clients(
     secrets: Dict, with_supabase: bool = False
 ) -> Tuple[bigquery.Client, Pinecone.Index, Optional[SupabaseClient]]:
+    from pinecone import Pinecone
+
     gcp_credentials = secrets.get("GCP_CREDENTIALS")
     bq_client = init_bigquery_client(credentials_dict=gcp_credentials)
 
@@ -44,6 +56,9 @@ def init_config(
     from_saved: bool = False,
     catalog_score_weights: Optional[List[float]] = None,
     days_lookback: Optional[int] = None,
+    prioritize: bool = False,
+    stale_after_hours: Optional[int] = None,
+    bqstorage_client: Optional[Any] = None,
 ) -> Config:
     if from_saved:
         if not supabase_client:
@@ -75,6 +90,100 @@ def init_config(
         ascending_saved=ascending_saved,
         catalog_score=catalog_score,
         days_lookback=days_lookback,
+        prioritize=prioritize,
+        stale_after_hours=stale_after_hours,
+        bqstorage_client=bqstorage_client,
     )
 
     return config
+
+
+def init_checker(script_config: ScriptConfig, secrets: Dict) -> AsyncAvailabilityChecker:
+    passwords = secrets.get("APIFY_PROXY_PASSWORD")
+    proxy_config = ProxyConfig(
+        password=passwords[script_config.proxy_password_position]
+    )
+
+    proxy_pool, cookie_cache = None, None
+
+    if script_config.use_proxy_pool:
+        proxy_pool = ProxyPool.from_passwords(
+            passwords=passwords,
+            proxy_types=script_config.proxy_types,
+            include_direct=script_config.proxy_include_direct,
+        )
+
+    if script_config.cookie_ttl:
+        cookie_cache = CookieCache(
+            ttl=script_config.cookie_ttl,
+            path=script_config.cookie_cache_path,
+        )
+
+    checker_class = CHECKER_STRATEGIES[script_config.probe_strategy]
+    checker_kwargs = {}
+
+    if script_config.probe_strategy == "head":
+        checker_kwargs["etags_path"] = script_config.etags_path
+
+    return checker_class(
+        proxy_config=proxy_config,
+        max_concurrency=script_config.max_concurrency,
+        requests_per_second=script_config.requests_per_second,
+        adaptive_concurrency=script_config.adaptive_concurrency,
+        max_attempts=script_config.max_attempts,
+        retry_with_proxy=script_config.retry_with_proxy,
+        cookie_cache=cookie_cache,
+        num_identities=script_config.num_identities,
+        identity_strategy=script_config.identity_strategy,
+        proxy_pool=proxy_pool,
+        record_path=script_config.record_responses_path,
+        session_prefix=script_config.session_prefix,
+        **checker_kwargs,
+    )
+
+
+def init_runner(
+    script_config: ScriptConfig,
+    config: Config,
+    secrets: Optional[Dict] = None,
+    clients: Optional[AsyncClients] = None,
+    create_tables: bool = True,
+) -> Runner:
+    secrets = secrets or load_json(script_config.secrets_path)
+
+    if create_tables:
+        create_check_table(config, script_config)
+
+    journal, sold_buffer = None, None
+
+    if script_config.journal_path:
+        journal = CheckJournal(
+            path=script_config.journal_path,
+            skip_window=script_config.journal_skip_window,
+        )
+
+    if script_config.sold_buffer_max_size:
+        sold_buffer = SoldBuffer(
+            max_size=script_config.sold_buffer_max_size,
+            max_age=script_config.sold_buffer_max_age,
+            wal_path=script_config.sold_buffer_wal_path,
+        )
+
+    return Runner(
+        config=config,
+        checker=init_checker(script_config, secrets),
+        delete_parallelism=script_config.delete_parallelism,
+        sold_buffer=sold_buffer,
+        journal=journal,
+        record_checks=script_config.record_checks,
+        clients=clients,
+    )
+
+
+def create_check_table(config: Config, script_config: ScriptConfig) -> None:
+    if (
+        script_config.record_checks
+        or script_config.prioritize
+        or script_config.stale_after_hours is not None
+    ):
+        run_query(client=config.bq_client, query=query_create_check_table())
@@ -0,0 +1,65 @@
+from typing import Dict, Optional
+
+from .models import CookieEntry
+from .enums import COOKIE_TTL, COOKIE_REFRESH_MARGIN
+from .utils import load_json, save_json
+
+
+class CookieCache:
+    def __init__(
+        self,
+        ttl: float = COOKIE_TTL,
+        refresh_margin: float = COOKIE_REFRESH_MARGIN,
+        path: Optional[str] = None,
+    ):
+        self.ttl = ttl
+        self.refresh_margin = min(refresh_margin, ttl)
+        self.path = path
+        self._entries: Dict[str, CookieEntry] = {}
+
+        if self.path:
+            self.load()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        entry = self._entries.get(key)
+
+        if entry is None or entry.age() >= self.ttl:
+            return None
+
+        return entry.cookies
+
+    def set(self, key: str, cookies: Dict[str, str]) -> None:
+        self._entries[key] = CookieEntry(cookies=cookies)
+
+        if self.path:
+            self.save()
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def age(self, key: str) -> Optional[float]:
+        entry = self._entries.get(key)
+        return entry.age() if entry else None
+
+    def needs_refresh(self, key: str) -> bool:
+        age = self.age(key)
+        return age is None or age >= self.ttl - self.refresh_margin
+
+    def load(self) -> None:
+        data = load_json(self.path) if self.path else None
+
+        if not data:
+            return
+
+        for key, entry_data in data.items():
+            try:
+                entry = CookieEntry.from_dict(entry_data)
+            except (KeyError, TypeError):
+                continue
+
+            if entry.age() < self.ttl:
+                self._entries[key] = entry
+
+    def save(self) -> bool:
+        data = {key: entry.to_dict() for key, entry in self._entries.items()}
+        return save_json(data, self.path)
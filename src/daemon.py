@@ -0,0 +1,99 @@
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import asyncio, logging, time
+
+from .models import Config, ScheduledJob
+from .runner import Runner
+
+
+JobHandler = Callable[[Runner], Awaitable[None]]
+ConfigFactory = Callable[[str], Config]
+
+
+class Daemon:
+    def __init__(
+        self,
+        runners: Dict[str, Runner],
+        jobs: List[ScheduledJob],
+        handlers: Dict[str, JobHandler],
+        config_factory: ConfigFactory,
+    ):
+        unknown = [job.name for job in jobs if job.name not in handlers]
+
+        if unknown:
+            raise ValueError(f"No handler for jobs: {unknown}")
+
+        missing = [job.name for job in jobs if job.name not in runners]
+
+        if missing:
+            raise ValueError(f"No runner for jobs: {missing}")
+
+        self.runners = runners
+        self.jobs = jobs
+        self.handlers = handlers
+        self.config_factory = config_factory
+        self.logger = logging.getLogger(__name__)
+        self._stop = asyncio.Event()
+        self._job_task: Optional[asyncio.Task] = None
+
+    def stop(self) -> None:
+        self._stop.set()
+
+        if self._job_task is not None and not self._job_task.done():
+            self._job_task.cancel()
+
+    async def run(self) -> None:
+        while not self._stop.is_set():
+            job = min(self.jobs, key=lambda job: job.due_in())
+            delay = job.due_in()
+
+            if delay > 0:
+                await self._sleep(delay)
+                continue
+
+            await self._run_job(job)
+
+    async def _sleep(self, delay: float) -> None:
+        try:
+            await asyncio.wait_for(self._stop.wait(), delay)
+
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_job(self, job: ScheduledJob) -> None:
+        runner = self.runners[job.name]
+        start = time.monotonic()
+        self.logger.info(f"Starting job: {job.name} (run #{job.n_runs + 1})")
+
+        try:
+            runner.config = await asyncio.to_thread(self.config_factory, job.name)
+            self._job_task = asyncio.ensure_future(self.handlers[job.name](runner))
+            await self._job_task
+            job.n_runs += 1
+
+        except asyncio.CancelledError:
+            if not self._stop.is_set():
+                raise
+
+            self.logger.info(f"Cancelled job: {job.name}")
+
+        except Exception as e:
+            job.n_failures += 1
+            self.logger.error(f"Error in job {job.name}: {str(e)}")
+
+        finally:
+            self._job_task = None
+            job.last_run_at = time.time()
+
+        try:
+            await runner.flush_async()
+
+        except Exception as e:
+            self.logger.error(f"Error flushing after job {job.name}: {str(e)}")
+
+        self.logger.info(
+            f"Finished job: {job.name} | "
+            f"Elapsed: {time.monotonic() - start:.1f}s | "
+            f"Runs: {job.n_runs} | "
+            f"Failures: {job.n_failures}"
+        )
@@ -0,0 +1,38 @@
+from typing import Set, Union
+
+from .models import PineconeDataLoader
+
+
+class SeenIds:
+    def __init__(self):
+        self._ids: Set[Union[int, str]] = set()
+        self.n_seen, self.n_duplicates = 0, 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, vinted_id: str) -> bool:
+        return self._key(vinted_id) in self._ids
+
+    @staticmethod
+    def _key(vinted_id: str) -> Union[int, str]:
+        try:
+            return int(vinted_id)
+        except (TypeError, ValueError):
+            return vinted_id
+
+    def add(self, vinted_id: str) -> bool:
+        key = self._key(vinted_id)
+        self.n_seen += 1
+
+        if key in self._ids:
+            self.n_duplicates += 1
+            return False
+
+        self._ids.add(key)
+        return True
+
+    def filter(self, loader: PineconeDataLoader) -> PineconeDataLoader:
+        return PineconeDataLoader(
+            [entry for entry in loader if self.add(entry.vinted_id)]
+        )
@@ -1,4 +1,4 @@
-from typing import Literal, List
+from typing import Literal, List, Dict
 
 PROJECT_ID = "recove-450509"
 VINTED_DATASET_ID = "vinted"
@@ -13,6 +13,7 @@ CLICK_OUT_TABLE_ID = "click_out"
 SAVED_TABLE_ID = "saved"
 VIEWED_ITEMS_TABLE_ID = "items"
 CATALOG_TABLE_ID = "catalog_importance"
+CHECK_TABLE_ID = "item_check"
 
 SUPABASE_SAVED_TABLE_ID = "saved_item"
 
@@ -26,6 +27,78 @@ INITIAL_SLEEP_TIME = 10
 MAX_SLEEP_TIME = 60
 RATE_LIMIT_SLEEP_TIME = 30
 
+REQUEST_TIMEOUT = 30
+CONNECTOR_LIMIT = 100
+CONNECTOR_LIMIT_PER_HOST = 100
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+MAX_CONCURRENCY = 50
+ADAPTIVE_INITIAL_CONCURRENCY = 10
+
+CHECK_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+COOKIE_TTL = 1800
+COOKIE_REFRESH_MARGIN = 300
+COOKIE_MIN_REFRESH_INTERVAL = 60
+DIRECT_COOKIE_KEY = "direct"
+
+IDENTITY_RETIRE_AFTER = 3
+IDENTITY_RETIRE_FOR = 300
+IDENTITY_SESSION_PREFIX = "availability"
+IDENTITY_REBIND_EVERY = 500
+
+IdentityStrategy = Literal["round_robin", "least_loaded"]
+
+PROXY_COSTS = {"direct": 0.0, "datacenter": 0.2, "residential": 1.0}
+PROXY_EXPLORATION = 0.05
+PROXY_MIN_SAMPLES = 10
+PROXY_LATENCY_ALPHA = 0.2
+PROXY_REBIND_RATIO = 0.5
+
+PIPELINE_QUEUE_SIZE = 2
+DELETE_PARALLELISM = 8
+QUERY_PARALLELISM = 16
+
+SUPERVISOR_CHUNK_SIZE = 1000
+SUPERVISOR_QUEUE_SIZE = 8
+SUPERVISOR_POLL_INTERVAL = 1.0
+
+CLIENT_MAX_WORKERS = 32
+BIGQUERY_MAX_CONCURRENCY = 8
+BIGQUERY_TIMEOUT = 300
+PINECONE_MAX_CONCURRENCY = 16
+PINECONE_TIMEOUT = 60
+SUPABASE_MAX_CONCURRENCY = 8
+SUPABASE_TIMEOUT = 30
+
+SOLD_BUFFER_MAX_SIZE = 500
+SOLD_BUFFER_MAX_AGE = 300
+SOLD_BUFFER_RETRY_DELAY = 30
+SOLD_BUFFER_MAX_RETRY_DELAY = 3600
+
+JOURNAL_SKIP_WINDOW = 6 * 3600
+JOURNAL_BUSY_TIMEOUT = 30
+
+ETAG_CACHE_SIZE = 200000
+RECORDING_FLUSH_SIZE = 100
+RECORDING_SENSITIVE_HEADERS = ("set-cookie", "cookie", "authorization", "proxy-authorization")
+RECORDING_REDACTED = "redacted"
+
 CatalogScore = Literal[1, 2, 3]
 CATALOG_SCORE_VALUES: List[CatalogScore] = [1, 2, 3]
-CATEGORY_TYPES: List[str] = ["outerwear", "top", "bottom", "dress", "accessories", "footwear"]
\ No newline at end of file
+CATEGORY_TYPES: List[str] = ["outerwear", "top", "bottom", "dress", "accessories", "footwear"]
+
+PRIORITY_CATALOG_WEIGHTS: Dict[CatalogScore, float] = {1: 1.0, 2: 0.6, 3: 0.3}
+PRIORITY_AGE_HALF_LIFE_DAYS = 7
+PRIORITY_INTERACTION_BOOST = 1.0
+PRIORITY_SOLD_RATE_DAYS = 30
+PRIORITY_SOLD_RATE_PRIOR = 0.01
+PRIORITY_CHECK_HALF_LIFE_HOURS = 24
+PRIORITY_CHECK_LOOKBACK_HOURS = 8 * PRIORITY_CHECK_HALF_LIFE_HOURS
+PRIORITY_JITTER = 0.2
+
+CHECK_LOOKBACK_DAYS = 30
+CHECK_FLUSH_SIZE = 5000
+CHECK_BUFFER_MAX_SIZE = 50000
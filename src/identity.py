@@ -0,0 +1,178 @@
+from typing import Callable, List, Optional
+
+import time
+
+from .models import CheckerIdentity, ProxyConfig, ProxyEndpoint
+from .proxy import ProxyPool
+from .enums import (
+    DIRECT_COOKIE_KEY,
+    IDENTITY_RETIRE_AFTER,
+    IDENTITY_RETIRE_FOR,
+    IDENTITY_SESSION_PREFIX,
+    IDENTITY_REBIND_EVERY,
+    IdentityStrategy,
+)
+
+
+RekeyCallback = Callable[[CheckerIdentity, str], None]
+
+
+def session_id(prefix: str, index: int, generation: int = 0) -> str:
+    return f"{prefix}_{index}_{generation}"
+
+
+class IdentityPool:
+    BLOCKED_STATUS_CODES = (403, 429)
+
+    def __init__(
+        self,
+        identities: List[CheckerIdentity],
+        strategy: IdentityStrategy = "least_loaded",
+        retire_after: int = IDENTITY_RETIRE_AFTER,
+        retire_for: float = IDENTITY_RETIRE_FOR,
+        session_prefix: str = IDENTITY_SESSION_PREFIX,
+        on_rekey: Optional[RekeyCallback] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        rebind_every: int = IDENTITY_REBIND_EVERY,
+    ):
+        if not identities:
+            raise ValueError("Identity pool requires at least one identity")
+
+        self.identities = identities
+        self.strategy = strategy
+        self.retire_after = retire_after
+        self.retire_for = retire_for
+        self.session_prefix = session_prefix
+        self.on_rekey = on_rekey
+        self.proxy_pool = proxy_pool
+        self.rebind_every = rebind_every
+        self._cursor = 0
+
+        if self.proxy_pool is not None:
+            for identity in self.identities:
+                self.bind(identity, self.proxy_pool.select(require_proxy=True))
+
+    @classmethod
+    def from_proxy_config(
+        cls,
+        proxy_config: Optional[ProxyConfig],
+        n: int = 1,
+        session_prefix: str = IDENTITY_SESSION_PREFIX,
+        **kwargs,
+    ) -> "IdentityPool":
+        if n <= 1 or proxy_config is None:
+            key = proxy_config.identity if proxy_config else DIRECT_COOKIE_KEY
+            identities = [CheckerIdentity(key=key, proxy_config=proxy_config)]
+
+            return cls(identities, session_prefix=session_prefix, **kwargs)
+
+        identities = []
+
+        for index in range(n):
+            session_proxy_config = proxy_config.with_session(
+                session_id(session_prefix, index)
+            )
+            identity = CheckerIdentity(
+                key=session_proxy_config.identity,
+                proxy_config=session_proxy_config,
+                index=index,
+            )
+            identities.append(identity)
+
+        return cls(identities, session_prefix=session_prefix, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.identities)
+
+    @property
+    def active(self) -> List[CheckerIdentity]:
+        return [identity for identity in self.identities if identity.is_active]
+
+    def retry_in(self) -> float:
+        if self.active:
+            return 0.0
+
+        retired_until = min(identity.retired_until for identity in self.identities)
+
+        return max(0.0, retired_until - time.monotonic())
+
+    def acquire(self, require_proxy: bool = False) -> CheckerIdentity:
+        candidates = self.active
+
+        if require_proxy:
+            candidates = [x for x in candidates if x.proxy_url] or candidates
+
+        if not candidates:
+            candidates = [min(self.identities, key=lambda x: x.retired_until)]
+
+        offset = self._cursor % len(candidates)
+        candidates = candidates[offset:] + candidates[:offset]
+        self._cursor += 1
+
+        if self.strategy == "least_loaded":
+            identity = min(candidates, key=lambda x: x.in_flight)
+        else:
+            identity = candidates[0]
+
+        identity.in_flight += 1
+        identity.n_requests += 1
+        identity.n_bound_requests += 1
+
+        return identity
+
+    def release(self, identity: CheckerIdentity, status_code: int) -> None:
+        identity.in_flight = max(0, identity.in_flight - 1)
+
+        if status_code not in self.BLOCKED_STATUS_CODES:
+            identity.n_blocked = 0
+        else:
+            identity.n_blocked += 1
+
+        if identity.n_blocked >= self.retire_after:
+            self.retire(identity)
+        elif self._should_rebind(identity):
+            self.rotate(identity)
+
+    def _should_rebind(self, identity: CheckerIdentity) -> bool:
+        if self.proxy_pool is None or identity.endpoint is None:
+            return False
+
+        if self.rebind_every and identity.n_bound_requests >= self.rebind_every:
+            return True
+
+        return self.proxy_pool.is_degraded(identity.endpoint)
+
+    def bind(self, identity: CheckerIdentity, endpoint: ProxyEndpoint) -> None:
+        session = session_id(self.session_prefix, identity.index, identity.generation)
+        identity.endpoint = endpoint
+        identity.n_bound_requests = 0
+
+        if endpoint.proxy_config is None:
+            identity.proxy_config = None
+            identity.key = f"{DIRECT_COOKIE_KEY}_{session}"
+        else:
+            identity.proxy_config = endpoint.proxy_config.with_session(session)
+            identity.key = identity.proxy_config.identity
+
+    def retire(self, identity: CheckerIdentity) -> None:
+        identity.retired_until = time.monotonic() + self.retire_for
+        identity.n_blocked = 0
+        self.rotate(identity)
+
+    def rotate(self, identity: CheckerIdentity) -> None:
+        old_key = identity.key
+        identity.cookies = None
+
+        if self.proxy_pool is not None:
+            identity.generation += 1
+            self.bind(identity, self.proxy_pool.select())
+
+        elif identity.proxy_config and identity.proxy_config.session_id:
+            identity.generation += 1
+            identity.proxy_config = identity.proxy_config.with_session(
+                session_id(self.session_prefix, identity.index, identity.generation)
+            )
+            identity.key = identity.proxy_config.identity
+
+        if self.on_rekey is not None:
+            self.on_rekey(identity, old_key)
@@ -0,0 +1,81 @@
+from typing import Iterable, Sequence, Set
+
+import sqlite3, time
+
+from .models import VintedItemStatus
+from .enums import JOURNAL_SKIP_WINDOW, JOURNAL_BUSY_TIMEOUT
+
+
+SQLITE_MAX_VARIABLES = 900
+
+
+class CheckJournal:
+    def __init__(
+        self,
+        path: str,
+        skip_window: float = JOURNAL_SKIP_WINDOW,
+        busy_timeout: float = JOURNAL_BUSY_TIMEOUT,
+    ):
+        self.path = path
+        self.skip_window = skip_window
+        self.connection = sqlite3.connect(path, timeout=busy_timeout)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checks (
+                vinted_id TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                is_available INTEGER NOT NULL,
+                checked_at REAL NOT NULL
+            )
+            """
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS checks_checked_at ON checks (checked_at)"
+        )
+        self.connection.commit()
+
+    def record(self, statuses: Iterable[VintedItemStatus]) -> None:
+        now = time.time()
+
+        rows = [
+            (status.item_id, status.status_code, int(status.is_available), now)
+            for status in statuses
+            if status.ok
+        ]
+
+        if not rows:
+            return
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO checks VALUES (?, ?, ?, ?)", rows
+            )
+
+    def checked_ids(self, vinted_ids: Sequence[str]) -> Set[str]:
+        since = time.time() - self.skip_window
+        checked = set()
+
+        for i in range(0, len(vinted_ids), SQLITE_MAX_VARIABLES):
+            batch = vinted_ids[i : i + SQLITE_MAX_VARIABLES]
+            placeholders = ", ".join("?" for _ in batch)
+
+            cursor = self.connection.execute(
+                f"SELECT vinted_id FROM checks "
+                f"WHERE checked_at >= ? AND vinted_id IN ({placeholders})",
+                [since, *batch],
+            )
+
+            checked.update(row[0] for row in cursor)
+
+        return checked
+
+    def prune(self) -> None:
+        since = time.time() - self.skip_window
+
+        with self.connection:
+            self.connection.execute("DELETE FROM checks WHERE checked_at < ?", (since,))
+
+    def close(self) -> None:
+        self.connection.close()
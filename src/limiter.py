@@ -0,0 +1,123 @@
+from typing import Optional, Dict, Deque, Tuple
+
+import time, asyncio
+from collections import deque
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+
+            self._tokens -= 1
+
+
+class AdaptiveLimiter:
+    BACKOFF_STATUS_CODES = (403, 429)
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+        stats_window: float = 60.0,
+    ):
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Decrease factor must be between 0 and 1")
+
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.stats_window = stats_window
+
+        if initial_limit is None:
+            initial_limit = max_limit
+
+        self.limit = float(min(max(initial_limit, self.min_limit), max_limit))
+        self._in_flight = 0
+        self._last_decrease_at = 0.0
+        self._events: Deque[Tuple[float, bool, bool]] = deque()
+        self._condition = asyncio.Condition()
+
+    @property
+    def window(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def should_backoff(self, status_code: int) -> bool:
+        return status_code in self.BACKOFF_STATUS_CODES or status_code >= 500
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.window)
+            self._in_flight += 1
+
+    async def release(self, status_code: int) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._record(status_code)
+            self._condition.notify_all()
+
+    def _record(self, status_code: int) -> None:
+        now = time.monotonic()
+        backoff = self.should_backoff(status_code)
+        self._events.append((now, status_code in (200, 404), backoff))
+
+        while self._events and now - self._events[0][0] > self.stats_window:
+            self._events.popleft()
+
+        if backoff:
+            if now - self._last_decrease_at >= self.cooldown:
+                self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                self._last_decrease_at = now
+        else:
+            self.limit = min(
+                self.max_limit, self.limit + self.increase_step / self.limit
+            )
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        n = len(self._events)
+        n_success = sum(1 for _, success, _ in self._events if success)
+        n_backoff = sum(1 for _, _, backoff in self._events if backoff)
+
+        if n > 1:
+            elapsed = self._events[-1][0] - self._events[0][0]
+        else:
+            elapsed = 0.0
+
+        return {
+            "window": self.window,
+            "in_flight": self._in_flight,
+            "success_rate": n_success / n if n > 0 else 0.0,
+            "backoff_rate": n_backoff / n if n > 0 else 0.0,
+            "requests_per_second": n / elapsed if elapsed > 0 else 0.0,
+        }
@@ -1,9 +1,15 @@
 from .config import Config
 from .loader import PineconeDataLoader, PineconeEntry
 from .status import VintedItemStatus
-from .proxy import ProxyConfig
+from .proxy import ProxyConfig, ProxyEndpoint
 from .script_config import ScriptConfig
-from .sold import SoldItem
+from .sold import SoldItem, ItemCheck
+from .cookies import CookieEntry
+from .identity import CheckerIdentity
+from .result import CheckResult
+from .replay import RecordedResponse
+from .stats import WorkerStats
+from .schedule import ScheduledJob
 
 
 __all__ = [
@@ -12,6 +18,14 @@ __all__ = [
     "PineconeEntry",
     "VintedItemStatus",
     "ProxyConfig",
+    "ProxyEndpoint",
     "ScriptConfig",
     "SoldItem",
+    "ItemCheck",
+    "CookieEntry",
+    "CheckerIdentity",
+    "CheckResult",
+    "RecordedResponse",
+    "WorkerStats",
+    "ScheduledJob",
 ]
@@ -1,12 +1,15 @@
-from typing import Optional
-from dataclasses import dataclass
+from __future__ import annotations
 
-from google.cloud import bigquery
-from pinecone import Pinecone
-from supabase import Client as SupabaseClient
+from typing import TYPE_CHECKING, Any, Optional
+from dataclasses import dataclass
 
 from src.enums import CatalogScore
 
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+    from pinecone import Pinecone
+    from supabase import Client as SupabaseClient
+
 
 @dataclass
 class Config:
@@ -20,6 +23,9 @@ class Config:
     supabase_client: Optional[SupabaseClient] = None
     catalog_score: Optional[CatalogScore] = None
     days_lookback: Optional[int] = None
+    prioritize: bool = False
+    stale_after_hours: Optional[int] = None
+    bqstorage_client: Optional[Any] = None
 
     def __post_init__(self):
         if not self.sort_by_date: 
@@ -33,7 +39,9 @@ class Config:
             f"from_saved={self.from_saved}, is_women={self.is_women}, "
             f"ascending_saved={self.ascending_saved}, "
             f"catalog_score={self.catalog_score}, "
-            f"days_lookback={self.days_lookback}"
+            f"days_lookback={self.days_lookback}, "
+            f"prioritize={self.prioritize}, "
+            f"stale_after_hours={self.stale_after_hours}"
             ")"
         )
 
@@ -0,0 +1,26 @@
+from typing import Dict
+from dataclasses import dataclass, field
+
+import time
+
+
+@dataclass
+class CookieEntry:
+    cookies: Dict[str, str]
+    fetched_at: float = field(default_factory=time.time)
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def to_dict(self) -> Dict:
+        return {
+            "cookies": self.cookies,
+            "fetched_at": self.fetched_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CookieEntry":
+        return cls(
+            cookies=data["cookies"],
+            fetched_at=data["fetched_at"],
+        )
@@ -0,0 +1,29 @@
+from typing import Dict, Optional
+from dataclasses import dataclass
+
+import time
+
+from .proxy import ProxyConfig, ProxyEndpoint
+
+
+@dataclass
+class CheckerIdentity:
+    key: str
+    proxy_config: Optional[ProxyConfig] = None
+    cookies: Optional[Dict[str, str]] = None
+    in_flight: int = 0
+    n_requests: int = 0
+    n_blocked: int = 0
+    retired_until: float = 0.0
+    index: int = 0
+    generation: int = 0
+    endpoint: Optional[ProxyEndpoint] = None
+    n_bound_requests: int = 0
+
+    @property
+    def is_active(self) -> bool:
+        return time.monotonic() >= self.retired_until
+
+    @property
+    def proxy_url(self) -> Optional[str]:
+        return self.proxy_config.url if self.proxy_config else None
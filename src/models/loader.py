@@ -1,12 +1,31 @@
-from typing import List, Iterator, Dict, Optional
-from dataclasses import dataclass, field
+from __future__ import annotations
 
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Iterable,
+    Iterator,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from types import MappingProxyType
+
+import sys
 from random import random
-from pinecone import ScoredVector
 
+if TYPE_CHECKING:
+    from pinecone import ScoredVector
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
 
-@dataclass
-class PineconeEntry:
+
+class PineconeEntry(NamedTuple):
     id: str
     point_id: str
     vinted_id: str
@@ -23,7 +42,7 @@ class PineconeEntry:
             point_id=vector.id,
             vinted_id=vector.metadata["vinted_id"],
             url=vector.metadata["url"],
-            category_type=metadata.get("category_type"),
+            category_type=_intern(metadata.get("category_type")),
             created_at=metadata.get("created_at"),
         )
 
@@ -34,31 +53,80 @@ class PineconeEntry:
             point_id=data["point_id"],
             vinted_id=data["vinted_id"],
             url=data["url"],
-            category_type=data.get("category_type"),
+            category_type=_intern(data.get("category_type")),
             created_at=data.get("created_at"),
         )
 
 
-@dataclass
 class PineconeDataLoader:
-    entries: List[PineconeEntry] = field(default_factory=list)
+    __slots__ = ("_entries", "_vinted_ids", "_by_namespace")
+
+    def __init__(self, entries: Iterable[PineconeEntry] = ()):
+        self._entries: List[PineconeEntry] = list(entries)
+        self._vinted_ids: Optional[Tuple[str, ...]] = None
+        self._by_namespace: Optional[Mapping[str, Tuple[PineconeEntry, ...]]] = None
+
+    def __repr__(self) -> str:
+        return f"PineconeDataLoader(n={len(self._entries)})"
 
     def add(self, entry: PineconeEntry) -> None:
-        self.entries.append(entry)
+        self._entries.append(entry)
+        self._vinted_ids = None
+        self._by_namespace = None
 
     def __iter__(self) -> Iterator[PineconeEntry]:
-        return iter(self.entries)
+        return iter(self._entries)
 
     def __len__(self) -> int:
-        return len(self.entries)
+        return len(self._entries)
 
     def __getitem__(self, index: int) -> PineconeEntry:
-        return self.entries[index]
+        return self._entries[index]
+
+    @classmethod
+    def from_record_batch(cls, record_batch: Any) -> "PineconeDataLoader":
+        columns = record_batch.to_pydict()
+        n = record_batch.num_rows
+        empty = [None] * n
+
+        entries = [
+            PineconeEntry(id, point_id, vinted_id, url, _intern(category_type), created_at)
+            for id, point_id, vinted_id, url, category_type, created_at in zip(
+                columns["id"],
+                columns["point_id"],
+                columns["vinted_id"],
+                columns["url"],
+                columns.get("category_type", empty),
+                columns.get("created_at", empty),
+            )
+        ]
+
+        return cls(entries)
+
+    @property
+    def entries(self) -> Tuple[PineconeEntry, ...]:
+        return tuple(self._entries)
 
     @property
     def total_rows(self) -> int:
-        return len(self.entries)
+        return len(self._entries)
 
     @property
-    def vinted_ids(self) -> List[str]:
-        return [entry.vinted_id for entry in self.entries]
+    def vinted_ids(self) -> Tuple[str, ...]:
+        if self._vinted_ids is None:
+            self._vinted_ids = tuple(entry.vinted_id for entry in self._entries)
+
+        return self._vinted_ids
+
+    def by_namespace(self) -> Mapping[str, Tuple[PineconeEntry, ...]]:
+        if self._by_namespace is None:
+            groups: Dict[str, List[PineconeEntry]] = {}
+
+            for entry in self._entries:
+                groups.setdefault(entry.category_type, []).append(entry)
+
+            self._by_namespace = MappingProxyType(
+                {namespace: tuple(entries) for namespace, entries in groups.items()}
+            )
+
+        return self._by_namespace
@@ -1,24 +1,93 @@
-from dataclasses import dataclass
+from typing import Dict, Optional, Literal
+
+import hashlib
+from dataclasses import dataclass, replace
+
+
+ProxyType = Literal["datacenter", "residential"]
 
 
 @dataclass
 class ProxyConfig:
     password: str
     country_code: str = "FR"
+    session_id: Optional[str] = None
+    proxy_type: ProxyType = "residential"
     _hostname: str = "proxy.apify.com"
     _port: int = 8000
 
+    @property
+    def _session_prefix(self) -> str:
+        return f"session-{self.session_id}," if self.session_id else ""
+
     @property
     def url_datacenter(self) -> str:
-        username = f"auto:{self.password}"
+        if self.session_id:
+            username = f"session-{self.session_id}:{self.password}"
+        else:
+            username = f"auto:{self.password}"
 
         return f"http://{username}@{self._hostname}:{self._port}"
 
     @property
     def url_residential(self) -> str:
-        username = f"groups-RESIDENTIAL,country-{self.country_code}:{self.password}"
+        username = (
+            f"groups-RESIDENTIAL,{self._session_prefix}"
+            f"country-{self.country_code}:{self.password}"
+        )
         return f"http://{username}@{self._hostname}:{self._port}"
 
     @property
     def url(self) -> str:
-        return self.url_residential
\ No newline at end of file
+        if self.proxy_type == "datacenter":
+            return self.url_datacenter
+
+        return self.url_residential
+
+    @property
+    def identity(self) -> str:
+        return hashlib.sha1(self.url.encode("utf-8")).hexdigest()[:16]
+
+    def with_session(self, session_id: str) -> "ProxyConfig":
+        return replace(self, session_id=session_id)
+
+
+@dataclass
+class ProxyEndpoint:
+    name: str
+    proxy_config: Optional[ProxyConfig] = None
+    cost: float = 0.0
+    n_requests: int = 0
+    n_success: int = 0
+    latency: Optional[float] = None
+
+    @property
+    def url(self) -> Optional[str]:
+        return self.proxy_config.url if self.proxy_config else None
+
+    @property
+    def success_rate(self) -> float:
+        return (self.n_success + 1) / (self.n_requests + 2)
+
+    @property
+    def score(self) -> float:
+        latency = self.latency if self.latency is not None else 1.0
+        return self.success_rate / (max(latency, 1e-3) * (1 + self.cost))
+
+    def record(self, ok: bool, latency: float, alpha: float) -> None:
+        self.n_requests += 1
+        self.n_success += int(ok)
+
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = alpha * latency + (1 - alpha) * self.latency
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "n_requests": self.n_requests,
+            "success_rate": self.success_rate,
+            "latency": self.latency,
+            "score": self.score,
+        }
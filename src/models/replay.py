@@ -0,0 +1,78 @@
+from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+
+import json
+from http.cookies import SimpleCookie
+
+
+@dataclass
+class RecordedResponse:
+    method: str
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    cookie_values: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def cookies(self) -> SimpleCookie:
+        cookies = SimpleCookie()
+
+        for key, value in self.cookie_values.items():
+            cookies[key] = value
+
+        return cookies
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag") or self.headers.get("etag")
+
+    @property
+    def size(self) -> int:
+        return len(self.body.encode("utf-8"))
+
+    async def read(self) -> bytes:
+        return self.body.encode("utf-8")
+
+    async def text(self) -> str:
+        return self.body
+
+    async def json(self, **kwargs) -> Any:
+        return json.loads(self.body)
+
+    def not_modified(self) -> "RecordedResponse":
+        return RecordedResponse(
+            method=self.method,
+            url=self.url,
+            status=304,
+            headers=dict(self.headers),
+            elapsed=self.elapsed,
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "body": self.body,
+            "cookies": self.cookie_values,
+            "elapsed": self.elapsed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RecordedResponse":
+        return cls(
+            method=data["method"],
+            url=data["url"],
+            status=data["status"],
+            headers=data.get("headers", {}),
+            body=data.get("body", ""),
+            cookie_values=data.get("cookies", {}),
+            elapsed=data.get("elapsed", 0.0),
+        )
@@ -0,0 +1,60 @@
+from typing import Dict, List
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from .status import VintedItemStatus
+
+
+@dataclass
+class CheckResult:
+    n: int = 0
+    n_success: int = 0
+    use_proxy: bool = False
+    item_ids: Dict[str, List[str]] = field(default_factory=lambda: defaultdict(list))
+    point_ids: Dict[str, List[str]] = field(default_factory=lambda: defaultdict(list))
+    vinted_ids: List[str] = field(default_factory=list)
+    failed: List[VintedItemStatus] = field(default_factory=list)
+    statuses: List[VintedItemStatus] = field(default_factory=list)
+
+    @property
+    def n_sold(self) -> int:
+        return len(self.vinted_ids)
+
+    @property
+    def n_proxied(self) -> int:
+        return sum(status.proxy is not None for status in self.statuses)
+
+    @property
+    def success_rate(self) -> float:
+        return self.n_success / self.n if self.n > 0 else 0.0
+
+    def merge(self, other: "CheckResult") -> None:
+        self.n += other.n
+        self.n_success += other.n_success
+        self.vinted_ids.extend(other.vinted_ids)
+        self.failed.extend(other.failed)
+
+        for namespace, ids in other.item_ids.items():
+            self.item_ids[namespace].extend(ids)
+
+        for namespace, ids in other.point_ids.items():
+            self.point_ids[namespace].extend(ids)
+
+    def to_sold_dict(self) -> Dict:
+        return {
+            "item_ids": dict(self.item_ids),
+            "point_ids": dict(self.point_ids),
+            "vinted_ids": self.vinted_ids,
+        }
+
+    @classmethod
+    def from_sold_dict(cls, data: Dict) -> "CheckResult":
+        result = cls(vinted_ids=list(data.get("vinted_ids", [])))
+
+        for namespace, ids in data.get("item_ids", {}).items():
+            result.item_ids[namespace].extend(ids)
+
+        for namespace, ids in data.get("point_ids", {}).items():
+            result.point_ids[namespace].extend(ids)
+
+        return result
@@ -0,0 +1,24 @@
+from typing import Dict, Optional
+from dataclasses import dataclass
+
+import time
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    interval: float = 0.0
+    last_run_at: Optional[float] = None
+    n_runs: int = 0
+    n_failures: int = 0
+
+    def due_in(self, now: Optional[float] = None) -> float:
+        if self.last_run_at is None:
+            return 0.0
+
+        now = now if now is not None else time.time()
+        return max(0.0, self.last_run_at + self.interval - now)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ScheduledJob":
+        return cls(name=data["NAME"], interval=data.get("INTERVAL", 0.0))
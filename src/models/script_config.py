@@ -1,6 +1,19 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List, Optional, Dict, Any, Literal
 
+import os
+
+from src.enums import (
+    CHECK_MAX_ATTEMPTS,
+    DELETE_PARALLELISM,
+    SOLD_BUFFER_MAX_AGE,
+    JOURNAL_SKIP_WINDOW,
+    QUERY_PARALLELISM,
+    SUPERVISOR_CHUNK_SIZE,
+    IDENTITY_SESSION_PREFIX,
+    IdentityStrategy,
+)
+
 
 ScriptConfigKey = Literal["ALL", "FROM_INTERACTIONS", "SAVED"]
 
@@ -19,6 +32,37 @@ class ScriptConfig:
     num_neighbors: Optional[int] = None
     days_lookback: Optional[int] = None
     catalog_score_weights: Optional[List[float]] = None
+    max_concurrency: Optional[int] = None
+    requests_per_second: Optional[float] = None
+    adaptive_concurrency: bool = False
+    max_attempts: int = CHECK_MAX_ATTEMPTS
+    retry_with_proxy: bool = True
+    cookie_ttl: Optional[int] = None
+    cookie_cache_path: Optional[str] = None
+    num_identities: int = 1
+    identity_strategy: IdentityStrategy = "least_loaded"
+    session_prefix: str = IDENTITY_SESSION_PREFIX
+    use_proxy_pool: bool = False
+    proxy_types: Optional[List[str]] = None
+    proxy_include_direct: bool = True
+    delete_parallelism: int = DELETE_PARALLELISM
+    sold_buffer_max_size: Optional[int] = None
+    sold_buffer_max_age: float = SOLD_BUFFER_MAX_AGE
+    sold_buffer_wal_path: Optional[str] = None
+    journal_path: Optional[str] = None
+    journal_skip_window: float = JOURNAL_SKIP_WINDOW
+    query_parallelism: int = QUERY_PARALLELISM
+    prioritize: bool = False
+    stale_after_hours: Optional[int] = None
+    record_checks: bool = False
+    shard: Optional[int] = None
+    num_shards: Optional[int] = None
+    use_arrow: bool = False
+    probe_strategy: str = "details"
+    record_responses_path: Optional[str] = None
+    etags_path: Optional[str] = None
+    num_workers: int = 1
+    worker_chunk_size: int = SUPERVISOR_CHUNK_SIZE
 
     @classmethod
     def from_config_dict(
@@ -27,16 +71,90 @@ class ScriptConfig:
         common_config = config_dict["COMMON"]
         script_config = config_dict[config_key]
 
+        def get(key: str, default: Any = None) -> Any:
+            return script_config.get(key, common_config.get(key, default))
+
+        def require(key: str) -> Any:
+            if key in script_config:
+                return script_config[key]
+
+            return common_config[key]
+
         return cls(
-            secrets_path=common_config["SECRETS_PATH"],
-            log_dir=common_config["LOG_DIR"],
-            use_proxy_alpha=common_config["USE_PROXY_ALPHA"],
-            proxy_password_position=common_config["PROXY_PASSWORD_POSITION"],
-            num_items=script_config["NUM_ITEMS"],
-            is_women_alpha=script_config.get("IS_WOMEN_ALPHA"),
-            sort_by_date_alpha=script_config.get("SORT_BY_DATE_ALPHA"),
-            run_every=script_config.get("RUN_EVERY"),
-            num_neighbors=script_config.get("NUM_NEIGHBORS"),
-            days_lookback=script_config.get("DAYS_LOOKBACK"),
-            catalog_score_weights=script_config.get("CATALOG_SCORE_WEIGHTS"),
+            secrets_path=require("SECRETS_PATH"),
+            log_dir=require("LOG_DIR"),
+            use_proxy_alpha=require("USE_PROXY_ALPHA"),
+            proxy_password_position=require("PROXY_PASSWORD_POSITION"),
+            num_items=require("NUM_ITEMS"),
+            is_women_alpha=get("IS_WOMEN_ALPHA"),
+            sort_by_date_alpha=get("SORT_BY_DATE_ALPHA"),
+            run_every=get("RUN_EVERY"),
+            num_neighbors=get("NUM_NEIGHBORS"),
+            days_lookback=get("DAYS_LOOKBACK"),
+            catalog_score_weights=get("CATALOG_SCORE_WEIGHTS"),
+            max_concurrency=get("MAX_CONCURRENCY"),
+            requests_per_second=get("REQUESTS_PER_SECOND"),
+            adaptive_concurrency=get("ADAPTIVE_CONCURRENCY", False),
+            max_attempts=get("MAX_ATTEMPTS", CHECK_MAX_ATTEMPTS),
+            retry_with_proxy=get("RETRY_WITH_PROXY", True),
+            cookie_ttl=get("COOKIE_TTL"),
+            cookie_cache_path=get("COOKIE_CACHE_PATH"),
+            num_identities=get("NUM_IDENTITIES", 1),
+            identity_strategy=get("IDENTITY_STRATEGY", "least_loaded"),
+            session_prefix=get("SESSION_PREFIX", IDENTITY_SESSION_PREFIX),
+            use_proxy_pool=get("USE_PROXY_POOL", False),
+            proxy_types=get("PROXY_TYPES"),
+            proxy_include_direct=get("PROXY_INCLUDE_DIRECT", True),
+            delete_parallelism=get("DELETE_PARALLELISM", DELETE_PARALLELISM),
+            sold_buffer_max_size=get("SOLD_BUFFER_MAX_SIZE"),
+            sold_buffer_max_age=get("SOLD_BUFFER_MAX_AGE", SOLD_BUFFER_MAX_AGE),
+            sold_buffer_wal_path=get("SOLD_BUFFER_WAL_PATH"),
+            journal_path=get("JOURNAL_PATH"),
+            journal_skip_window=get("JOURNAL_SKIP_WINDOW", JOURNAL_SKIP_WINDOW),
+            query_parallelism=get("QUERY_PARALLELISM", QUERY_PARALLELISM),
+            prioritize=get("PRIORITIZE", False),
+            stale_after_hours=get("STALE_AFTER_HOURS"),
+            record_checks=get("RECORD_CHECKS", False),
+            shard=_env_int("SHARD", get("SHARD")),
+            num_shards=_env_int("NUM_SHARDS", get("NUM_SHARDS")),
+            use_arrow=get("USE_ARROW", False),
+            probe_strategy=get("PROBE_STRATEGY", "details"),
+            record_responses_path=get("RECORD_RESPONSES_PATH"),
+            etags_path=get("ETAGS_PATH"),
+            num_workers=get("NUM_WORKERS", 1),
+            worker_chunk_size=get("WORKER_CHUNK_SIZE", SUPERVISOR_CHUNK_SIZE),
+        )
+
+    def for_worker(self, worker_id: int) -> "ScriptConfig":
+        suffix = f"worker{worker_id}"
+
+        return replace(
+            self,
+            cookie_cache_path=_suffixed_path(self.cookie_cache_path, suffix),
+            sold_buffer_wal_path=_suffixed_path(self.sold_buffer_wal_path, suffix),
+            record_responses_path=_suffixed_path(self.record_responses_path, suffix),
+            etags_path=_suffixed_path(self.etags_path, suffix),
+            session_prefix=f"{self.session_prefix}_{suffix}",
         )
+
+    def for_job(self, name: str) -> "ScriptConfig":
+        return replace(
+            self,
+            cookie_cache_path=_suffixed_path(self.cookie_cache_path, name),
+            record_responses_path=_suffixed_path(self.record_responses_path, name),
+            etags_path=_suffixed_path(self.etags_path, name),
+            session_prefix=f"{self.session_prefix}_{name}",
+        )
+
+
+def _env_int(key: str, default: Optional[int] = None) -> Optional[int]:
+    value = os.environ.get(key)
+    return int(value) if value is not None else default
+
+
+def _suffixed_path(path: Optional[str], suffix: str) -> Optional[str]:
+    if not path:
+        return path
+
+    root, ext = os.path.splitext(path)
+    return f"{root}_{suffix}{ext}"
@@ -1,6 +1,6 @@
 from typing import Dict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 @dataclass
@@ -14,4 +14,20 @@ class SoldItem:
         return {
             "vinted_id": self.id,
             "updated_at": self.updated_at,
-        }
\ No newline at end of file
+        }
+
+
+@dataclass
+class ItemCheck:
+    id: str
+    status_code: int
+
+    def __post_init__(self):
+        self.checked_at = datetime.now(timezone.utc).isoformat()
+
+    def to_dict(self) -> Dict:
+        return {
+            "vinted_id": self.id,
+            "status_code": self.status_code,
+            "checked_at": self.checked_at,
+        }
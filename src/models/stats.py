@@ -0,0 +1,44 @@
+from typing import Dict
+from dataclasses import dataclass
+
+from .result import CheckResult
+
+
+@dataclass
+class WorkerStats:
+    n_batches: int = 0
+    n: int = 0
+    n_success: int = 0
+    n_sold: int = 0
+    n_updated: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        return self.n_success / self.n if self.n > 0 else 0.0
+
+    def merge(self, other: "WorkerStats") -> None:
+        self.n_batches += other.n_batches
+        self.n += other.n
+        self.n_success += other.n_success
+        self.n_sold += other.n_sold
+        self.n_updated += other.n_updated
+
+    def to_dict(self) -> Dict:
+        return {
+            "n_batches": self.n_batches,
+            "n": self.n,
+            "n_success": self.n_success,
+            "n_sold": self.n_sold,
+            "n_updated": self.n_updated,
+            "success_rate": self.success_rate,
+        }
+
+    @classmethod
+    def from_result(cls, result: CheckResult, updated: bool = False) -> "WorkerStats":
+        return cls(
+            n_batches=1,
+            n=result.n,
+            n_success=result.n_success,
+            n_sold=result.n_sold,
+            n_updated=int(bool(updated)),
+        )
@@ -8,6 +8,8 @@ class VintedItemStatus:
     status_code: int
     is_available: bool = True
     error: Optional[str] = None
+    attempts: int = 1
+    proxy: Optional[str] = None
 
     def to_dict(self) -> Dict:
         return {
@@ -15,6 +17,8 @@ class VintedItemStatus:
             "is_available": self.is_available,
             "status_code": self.status_code,
             "error": self.error,
+            "attempts": self.attempts,
+            "proxy": self.proxy,
         }
 
     @property
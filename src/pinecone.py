@@ -1,13 +1,38 @@
-from typing import List, Tuple, Dict, Optional
-
-import time
-from tqdm import tqdm
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Tuple,
+    Dict,
+    Optional,
+    Iterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
+
+import time, asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta
-from google.cloud import bigquery
 
-from pinecone.data.index import Index, ScoredVector
 from .models import PineconeEntry, PineconeDataLoader
+from .enums import (
+    MAX_RETRIES,
+    INITIAL_SLEEP_TIME,
+    MAX_SLEEP_TIME,
+    DELETE_PARALLELISM,
+    QUERY_PARALLELISM,
+)
+
+
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+    from pinecone.data.index import Index
+
 
+AsyncCall = Callable[..., Awaitable[Any]]
 
 BATCH_SIZE = 1000
 MAX_LIMIT = 100
@@ -18,6 +43,8 @@ def list_points(
     index: Index,
     n: int,
 ) -> PineconeDataLoader:
+    from tqdm import tqdm
+
     ix, pagination_token = 0, None
     loader = PineconeDataLoader()
 
@@ -67,6 +94,8 @@ def delete_points_from_ids(
     n_success, failed = 0, []
 
     if verbose:
+        from tqdm import tqdm
+
         iterator = tqdm(iterable=iterator, total=int(len(ids) // BATCH_SIZE))
 
     for i in iterator:
@@ -92,6 +121,70 @@ def delete_points_from_ids(
     return success_rate, failed
 
 
+async def delete_points_by_namespace_async(
+    index: Index,
+    point_ids: Dict[str, List[str]],
+    max_parallel: int = DELETE_PARALLELISM,
+    call: AsyncCall = asyncio.to_thread,
+) -> Dict[str, Tuple[float, List[str]]]:
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+    async def delete_batch(namespace: str, batch: List[str]) -> bool:
+        async with semaphore:
+            return await _delete_batch_async(index, batch, namespace, call=call)
+
+    batches = [
+        (namespace, ids[i : i + BATCH_SIZE])
+        for namespace, ids in point_ids.items()
+        for i in range(0, len(ids), BATCH_SIZE)
+    ]
+
+    successes = await asyncio.gather(
+        *[delete_batch(namespace, batch) for namespace, batch in batches]
+    )
+
+    counts, results = defaultdict(lambda: [0, 0]), {}
+    failed = defaultdict(list)
+
+    for (namespace, batch), success in zip(batches, successes):
+        counts[namespace][0] += 1
+        counts[namespace][1] += int(success)
+
+        if not success:
+            failed[namespace].extend(batch)
+
+    for namespace in point_ids:
+        n, n_success = counts[namespace]
+        success_rate = n_success / n if n > 0 else 0.0
+        results[namespace] = (success_rate, failed[namespace])
+
+    return results
+
+
+async def _delete_batch_async(
+    index: Index,
+    batch: List[str],
+    namespace: str,
+    max_retries: int = MAX_RETRIES,
+    sleep_time: int = INITIAL_SLEEP_TIME,
+    call: AsyncCall = asyncio.to_thread,
+) -> bool:
+    for attempt in range(max_retries):
+        try:
+            response = await call(index.delete, ids=batch, namespace=namespace)
+
+            if len(response) == 0:
+                return True
+
+        except Exception as e:
+            print(e)
+
+        if attempt < max_retries - 1:
+            await asyncio.sleep(min(sleep_time * 2**attempt, MAX_SLEEP_TIME))
+
+    return False
+
+
 def delete_points_from_bigquery_iterator(
     index: Index,
     iterator: bigquery.table.RowIterator,
@@ -101,6 +194,8 @@ def delete_points_from_bigquery_iterator(
 ) -> Tuple[float, List[str]]:
     total_rows = iterator.total_rows
     if verbose:
+        from tqdm import tqdm
+
         iterator = tqdm(
             iterable=enumerate(iterator),
             total=total_rows,
@@ -173,6 +268,76 @@ def get_neighbors(
     return loader
 
 
+async def get_neighbors_async(
+    index: Index,
+    namespace: str,
+    point_id: str,
+    n: int,
+    days_lookback: Optional[int] = None,
+    call: AsyncCall = asyncio.to_thread,
+) -> PineconeDataLoader:
+    return await call(
+        get_neighbors,
+        index=index,
+        namespace=namespace,
+        point_id=point_id,
+        n=n,
+        days_lookback=days_lookback,
+    )
+
+
+async def iter_neighbors(
+    index: Index,
+    queries: Iterable[Tuple[str, str]],
+    n: int,
+    days_lookback: Optional[int] = None,
+    max_parallel: int = QUERY_PARALLELISM,
+    call: AsyncCall = asyncio.to_thread,
+) -> AsyncIterator[PineconeDataLoader]:
+    tasks = set()
+
+    for point_id, namespace in queries:
+        if namespace is None:
+            continue
+
+        task = asyncio.create_task(
+            get_neighbors_async(
+                index=index,
+                namespace=namespace,
+                point_id=point_id,
+                n=n,
+                days_lookback=days_lookback,
+                call=call,
+            )
+        )
+        tasks.add(task)
+
+        if len(tasks) >= max_parallel:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+            for loader in _completed_loaders(done):
+                yield loader
+
+    while tasks:
+        done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+        for loader in _completed_loaders(done):
+            yield loader
+
+
+def _completed_loaders(tasks: Iterable[asyncio.Task]) -> List[PineconeDataLoader]:
+    loaders = []
+
+    for task in tasks:
+        if task.exception() is not None:
+            print(task.exception())
+            continue
+
+        loaders.append(task.result())
+
+    return loaders
+
+
 def create_filter(days_lookback: int) -> Dict:
     now = datetime.now()
     start_date = int((now - timedelta(days=days_lookback)).timestamp())
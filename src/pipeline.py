@@ -0,0 +1,208 @@
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+import asyncio, logging
+from itertools import islice
+
+from .models import CheckResult, PineconeDataLoader, PineconeEntry
+from .runner import Runner
+from .enums import PIPELINE_QUEUE_SIZE
+from .utils import use_proxy_func
+
+
+BatchCallback = Callable[[CheckResult, Optional[bool]], None]
+Loaders = Union[Iterator[PineconeDataLoader], AsyncIterator[PineconeDataLoader]]
+
+
+def _batch_rows(rows: Iterable, n: int) -> Iterator[PineconeDataLoader]:
+    iterator = iter(rows)
+
+    while True:
+        batch = list(islice(iterator, n))
+
+        if not batch:
+            break
+
+        yield PineconeDataLoader([PineconeEntry.from_dict(dict(row)) for row in batch])
+
+
+async def _abatch_rows(rows: AsyncIterable, n: int) -> AsyncIterator[PineconeDataLoader]:
+    batch = []
+
+    async for row in rows:
+        batch.append(PineconeEntry.from_dict(dict(row)))
+
+        if len(batch) >= n:
+            yield PineconeDataLoader(batch)
+            batch = []
+
+    if batch:
+        yield PineconeDataLoader(batch)
+
+
+def _batch_record_batches(
+    record_batches: Iterable, n: int
+) -> Iterator[PineconeDataLoader]:
+    pending: List[PineconeEntry] = []
+
+    for record_batch in record_batches:
+        offset = 0
+
+        if pending:
+            offset = n - len(pending)
+            pending.extend(
+                PineconeDataLoader.from_record_batch(record_batch.slice(0, offset))
+            )
+
+            if len(pending) < n:
+                continue
+
+            yield PineconeDataLoader(pending)
+            pending = []
+
+        while record_batch.num_rows - offset >= n:
+            yield PineconeDataLoader.from_record_batch(record_batch.slice(offset, n))
+            offset += n
+
+        if offset < record_batch.num_rows:
+            pending = list(
+                PineconeDataLoader.from_record_batch(record_batch.slice(offset))
+            )
+
+    if pending:
+        yield PineconeDataLoader(pending)
+
+
+class Pipeline:
+    def __init__(
+        self,
+        runner: Runner,
+        batch_size: int,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        use_proxy_alpha: Optional[float] = None,
+        on_batch: Optional[BatchCallback] = None,
+    ):
+        self.runner = runner
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.use_proxy_alpha = use_proxy_alpha
+        self.on_batch = on_batch
+        self.logger = logging.getLogger(__name__)
+        self._use_proxy = False
+
+    async def run(self, rows: Union[Iterable, AsyncIterable]) -> None:
+        if isinstance(rows, AsyncIterable):
+            await self._run(_abatch_rows(rows, self.batch_size))
+        else:
+            await self._run(_batch_rows(rows, self.batch_size))
+
+    async def run_record_batches(self, record_batches: Iterable) -> None:
+        await self._run(_batch_record_batches(record_batches, self.batch_size))
+
+    async def _run(self, loaders: Loaders) -> None:
+        check_queue = asyncio.Queue(maxsize=self.queue_size)
+        update_queue = asyncio.Queue(maxsize=self.queue_size)
+
+        tasks = [
+            asyncio.create_task(self._produce(loaders, check_queue)),
+            asyncio.create_task(self._check(check_queue, update_queue)),
+            asyncio.create_task(self._update(update_queue)),
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+
+        except Exception:
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+    async def _produce(self, loaders: Loaders, queue: asyncio.Queue) -> None:
+        if isinstance(loaders, AsyncIterator):
+            async for loader in loaders:
+                await queue.put(loader)
+
+            await queue.put(None)
+            return
+
+        while True:
+            loader = await asyncio.to_thread(next, loaders, None)
+
+            if loader is None:
+                break
+
+            await queue.put(loader)
+
+        await queue.put(None)
+
+    async def _check(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue) -> None:
+        while True:
+            loader = await in_queue.get()
+
+            if loader is None:
+                break
+
+            if self.use_proxy_alpha is not None and self.runner.checker.proxy_pool is None:
+                self._use_proxy = use_proxy_func(self._use_proxy, self.use_proxy_alpha)
+
+            try:
+                result = await self.runner.check_async(loader, self._use_proxy)
+
+            except Exception as e:
+                self.logger.error(f"Error in check stage: {str(e)}")
+                result = CheckResult(use_proxy=self._use_proxy)
+
+            await out_queue.put(result)
+
+        await out_queue.put(None)
+
+    async def _update(self, queue: asyncio.Queue) -> None:
+        while True:
+            try:
+                result = await asyncio.wait_for(queue.get(), self._flush_timeout())
+
+            except asyncio.TimeoutError:
+                await self._flush()
+                continue
+
+            if result is None:
+                break
+
+            updated = False
+
+            if result.n > 0:
+                try:
+                    updated = await self.runner.commit_async(result)
+
+                except Exception as e:
+                    self.logger.error(f"Error in update stage: {str(e)}")
+
+            if self.on_batch is not None:
+                self.on_batch(result, updated)
+
+        await self._flush()
+
+    def _flush_timeout(self) -> Optional[float]:
+        if self.runner.sold_buffer is None:
+            return None
+
+        return self.runner.sold_buffer.time_until_flush()
+
+    async def _flush(self) -> None:
+        try:
+            await self.runner.flush_async()
+
+        except Exception as e:
+            self.logger.error(f"Error flushing sold buffer: {str(e)}")
+
+            if self.runner.sold_buffer is not None and len(self.runner.sold_buffer):
+                self.runner.sold_buffer.defer()
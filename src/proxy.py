@@ -0,0 +1,104 @@
+from typing import Dict, List, Optional
+
+import random
+
+from .models import ProxyConfig, ProxyEndpoint
+from .models.proxy import ProxyType
+from .enums import (
+    PROXY_COSTS,
+    PROXY_EXPLORATION,
+    PROXY_MIN_SAMPLES,
+    PROXY_LATENCY_ALPHA,
+    PROXY_REBIND_RATIO,
+)
+
+
+class ProxyPool:
+    def __init__(
+        self,
+        endpoints: List[ProxyEndpoint],
+        exploration: float = PROXY_EXPLORATION,
+        min_samples: int = PROXY_MIN_SAMPLES,
+        latency_alpha: float = PROXY_LATENCY_ALPHA,
+        rebind_ratio: float = PROXY_REBIND_RATIO,
+    ):
+        if not endpoints:
+            raise ValueError("Proxy pool requires at least one endpoint")
+
+        self.endpoints = endpoints
+        self.exploration = exploration
+        self.min_samples = min_samples
+        self.latency_alpha = latency_alpha
+        self.rebind_ratio = rebind_ratio
+
+    @classmethod
+    def from_passwords(
+        cls,
+        passwords: List[str],
+        proxy_types: Optional[List[ProxyType]] = None,
+        include_direct: bool = True,
+        country_code: str = "FR",
+        **kwargs,
+    ) -> "ProxyPool":
+        proxy_types = proxy_types or ["datacenter", "residential"]
+        endpoints = []
+
+        if include_direct:
+            endpoints.append(ProxyEndpoint(name="direct", cost=PROXY_COSTS["direct"]))
+
+        for ix, password in enumerate(passwords):
+            for proxy_type in proxy_types:
+                proxy_config = ProxyConfig(
+                    password=password,
+                    country_code=country_code,
+                    proxy_type=proxy_type,
+                )
+
+                endpoint = ProxyEndpoint(
+                    name=f"{proxy_type}_{ix}",
+                    proxy_config=proxy_config,
+                    cost=PROXY_COSTS[proxy_type],
+                )
+                endpoints.append(endpoint)
+
+        return cls(endpoints, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def select(self, require_proxy: bool = False) -> ProxyEndpoint:
+        endpoints = self._candidates(require_proxy)
+        unexplored = [e for e in endpoints if e.n_requests < self.min_samples]
+
+        if unexplored:
+            return random.choice(unexplored)
+
+        if random.random() < self.exploration:
+            return random.choice(endpoints)
+
+        return max(endpoints, key=lambda x: x.score)
+
+    def is_degraded(self, endpoint: ProxyEndpoint) -> bool:
+        if endpoint.n_requests < self.min_samples:
+            return False
+
+        explored = [e for e in self.endpoints if e.n_requests >= self.min_samples]
+        best = max(explored, key=lambda x: x.score)
+
+        return endpoint.score < self.rebind_ratio * best.score
+
+    def _candidates(self, require_proxy: bool) -> List[ProxyEndpoint]:
+        if require_proxy:
+            proxied = [e for e in self.endpoints if e.proxy_config is not None]
+
+            if proxied:
+                return proxied
+
+        return self.endpoints
+
+    def record(self, endpoint: ProxyEndpoint, ok: bool, latency: float) -> None:
+        endpoint.record(ok=ok, latency=latency, alpha=self.latency_alpha)
+
+    @property
+    def stats(self) -> List[Dict]:
+        return [endpoint.to_dict() for endpoint in self.endpoints]
@@ -0,0 +1,204 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import re, json, time, asyncio
+from contextlib import asynccontextmanager
+
+from .models import RecordedResponse, VintedItemStatus
+from .enums import RECORDING_FLUSH_SIZE, RECORDING_SENSITIVE_HEADERS, RECORDING_REDACTED
+
+
+ITEM_URL_PATTERN = re.compile(r"/items/(\d+)")
+
+
+def load_responses(path: str) -> List[RecordedResponse]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [RecordedResponse.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+def recorded_items(responses: Iterable[RecordedResponse]) -> Dict[str, Optional[str]]:
+    items = {}
+
+    for response in responses:
+        match = ITEM_URL_PATTERN.search(response.url)
+
+        if match is None:
+            continue
+
+        vinted_id = match.group(1)
+
+        if "/api/" in response.url:
+            items.setdefault(vinted_id, None)
+        else:
+            items[vinted_id] = response.url
+
+    return items
+
+
+def _redacted(recorded: RecordedResponse) -> Dict:
+    data = recorded.to_dict()
+    data["headers"] = {
+        key: value
+        for key, value in recorded.headers.items()
+        if key.lower() not in RECORDING_SENSITIVE_HEADERS
+    }
+    data["cookies"] = {key: RECORDING_REDACTED for key in recorded.cookie_values}
+
+    return data
+
+
+def _append_lines(path: str, lines: List[str]) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+class RecordingSession:
+    def __init__(self, session, path: str, flush_size: int = RECORDING_FLUSH_SIZE):
+        self.session = session
+        self.path = path
+        self.flush_size = flush_size
+        self._pending: List[str] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self.session.closed
+
+    async def close(self) -> None:
+        await self.flush()
+        await self.session.close()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            lines, self._pending = self._pending, []
+
+            if lines:
+                await asyncio.to_thread(_append_lines, self.path, lines)
+
+    def get(self, url: str, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs):
+        return self._request("HEAD", url, **kwargs)
+
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs):
+        start = time.monotonic()
+
+        async with self.session.request(method, url, **kwargs) as response:
+            body = await response.read()
+
+            recorded = RecordedResponse(
+                method=method,
+                url=url,
+                status=response.status,
+                headers=dict(response.headers),
+                body=body.decode("utf-8", errors="replace"),
+                cookie_values={
+                    cookie.key: cookie.value for cookie in response.cookies.values()
+                },
+                elapsed=time.monotonic() - start,
+            )
+
+        self._pending.append(json.dumps(_redacted(recorded)) + "\n")
+
+        if len(self._pending) >= self.flush_size:
+            await self.flush()
+
+        yield recorded
+
+
+class ReplaySession:
+    def __init__(self, responses: Iterable[RecordedResponse], miss_status: int = 599):
+        self.responses: Dict[Tuple[str, str], RecordedResponse] = {
+            (response.method, response.url): response for response in responses
+        }
+        self.miss_status = miss_status
+        self.closed = False
+        self.reset()
+
+    def reset(self) -> None:
+        self.n_requests, self.n_misses, self.n_bytes = 0, 0, 0
+        self.elapsed = 0.0
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def get(self, url: str, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs):
+        return self._request("HEAD", url, **kwargs)
+
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, headers: Optional[Dict] = None, **kwargs):
+        response = self.responses.get((method, url))
+        self.n_requests += 1
+
+        if response is None:
+            self.n_misses += 1
+            yield RecordedResponse(method=method, url=url, status=self.miss_status)
+            return
+
+        etag = (headers or {}).get("If-None-Match")
+
+        if etag and etag == response.etag:
+            response = response.not_modified()
+
+        self.n_bytes += response.size
+        self.elapsed += response.elapsed
+
+        yield response
+
+
+async def benchmark(
+    checker,
+    responses: List[RecordedResponse],
+    items: Dict[str, Optional[str]],
+    baseline: Optional[Dict[str, bool]] = None,
+    warm: bool = True,
+) -> Tuple[Dict[str, Dict[str, float]], List[VintedItemStatus]]:
+    session = ReplaySession(responses)
+    checker.set_session(session)
+
+    item_ids = list(items)
+    urls = [items[item_id] for item_id in item_ids]
+    passes = ["cold", "warm"] if warm else ["cold"]
+    stats, statuses = {}, []
+
+    for name in passes:
+        session.reset()
+        probe_stats = dict(getattr(checker, "probe_stats", None) or {})
+        statuses = await checker.run(item_ids, urls=urls)
+        stats[name] = _pass_stats(session, statuses, baseline)
+
+        for key, value in (getattr(checker, "probe_stats", None) or {}).items():
+            stats[name][f"n_{key}"] = value - probe_stats.get(key, 0)
+
+    return stats, statuses
+
+
+def _pass_stats(
+    session: ReplaySession,
+    statuses: List[VintedItemStatus],
+    baseline: Optional[Dict[str, bool]],
+) -> Dict[str, float]:
+    stats = {
+        "n": len(statuses),
+        "n_ok": sum(status.ok for status in statuses),
+        "n_requests": session.n_requests,
+        "n_misses": session.n_misses,
+        "n_bytes": session.n_bytes,
+        "elapsed": session.elapsed,
+        "requests_per_item": session.n_requests / max(1, len(statuses)),
+    }
+
+    if baseline:
+        compared = [
+            status for status in statuses if status.ok and status.item_id in baseline
+        ]
+        agreed = sum(
+            status.is_available == baseline[status.item_id] for status in compared
+        )
+        stats["agreement"] = agreed / len(compared) if compared else 0.0
+
+    return stats
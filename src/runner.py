@@ -2,21 +2,60 @@ from typing import List, Tuple, Optional, Dict
 from collections import defaultdict
 from datetime import datetime
 
+import asyncio, logging
 
-from src.models import Config, PineconeDataLoader
+
+from src.models import (
+    Config,
+    PineconeDataLoader,
+    VintedItemStatus,
+    CheckResult,
+    ItemCheck,
+)
 from src.bigquery import query_pinecone_points, run_query, insert_rows_json
 from src.supabase import set_items_unavailable
 from src.pinecone import delete_points_from_ids
 from src.checker import BaseAvailabilityChecker
+from src.clients import AsyncClients
+from src.buffer import SoldBuffer
+from src.journal import CheckJournal
+from src.enums import DELETE_PARALLELISM, CHECK_FLUSH_SIZE, CHECK_BUFFER_MAX_SIZE
 
 
 SUCCESS_RATE_THRESHOLD = 0.9
 
 
 class Runner:
-    def __init__(self, config: Config, checker: BaseAvailabilityChecker):
+    def __init__(
+        self,
+        config: Config,
+        checker: BaseAvailabilityChecker,
+        delete_parallelism: int = DELETE_PARALLELISM,
+        sold_buffer: Optional[SoldBuffer] = None,
+        journal: Optional[CheckJournal] = None,
+        record_checks: bool = False,
+        clients: Optional[AsyncClients] = None,
+        check_flush_size: int = CHECK_FLUSH_SIZE,
+    ):
+        self.clients = clients or AsyncClients()
         self.config = config
         self.checker = checker
+        self.delete_parallelism = delete_parallelism
+        self.sold_buffer = sold_buffer
+        self.journal = journal
+        self.record_checks = record_checks
+        self.check_flush_size = check_flush_size
+        self._checks: List[ItemCheck] = []
+        self.failed: List[VintedItemStatus] = []
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @config.setter
+    def config(self, config: Config) -> None:
+        self._config = config
+        self.clients.bind(config)
 
     def run(
         self,
@@ -51,29 +90,192 @@ class Runner:
         data_loader: PineconeDataLoader,
         use_proxy: bool = False,
     ) -> Tuple[int, bool, float]:
-        vinted_ids = data_loader.vinted_ids
-        api_response = await self.checker.run(vinted_ids, use_proxy)
+        self.failed = []
+        result = await self.check_async(data_loader, use_proxy)
+        self.failed = result.failed
 
-        if not api_response:
+        if result.n == 0:
             return 0, False, 0.0
 
-        n, n_success = 0, 0
-        item_ids, point_ids, vinted_ids = defaultdict(list), defaultdict(list), []
+        updated = await self.commit_async(result)
 
-        for entry, status in zip(data_loader, api_response):
-            n += 1
-            n_success += int(status.ok)
+        return result.n_sold, updated, result.success_rate
 
-            if status.ok and not status.is_available:
-                item_ids[entry.category_type].append(entry.id)
-                point_ids[entry.category_type].append(entry.point_id)
-                vinted_ids.append(entry.vinted_id)
+    async def check_async(
+        self,
+        data_loader: PineconeDataLoader,
+        use_proxy: bool = False,
+    ) -> CheckResult:
+        if self.journal is not None:
+            data_loader = self._skip_checked(data_loader)
 
-        updated = self._update(item_ids, vinted_ids, point_ids)
-        n_sold = len(vinted_ids)
-        success_rate = n_success / n if n > 0 else 0
+        vinted_ids = data_loader.vinted_ids
+        urls = [entry.url for entry in data_loader]
+        api_response = await self.checker.run(vinted_ids, use_proxy, urls=urls)
+        result = CheckResult(use_proxy=use_proxy)
+        sold = set()
 
-        return n_sold, updated, success_rate
+        for status in api_response:
+            result.n += 1
+            result.n_success += int(status.ok)
+            result.statuses.append(status)
+
+            if not status.ok:
+                result.failed.append(status)
+            elif not status.is_available:
+                sold.add(status.item_id)
+
+        if not sold:
+            return result
+
+        for namespace, entries in data_loader.by_namespace().items():
+            for entry in entries:
+                if entry.vinted_id in sold:
+                    result.item_ids[namespace].append(entry.id)
+                    result.point_ids[namespace].append(entry.point_id)
+                    result.vinted_ids.append(entry.vinted_id)
+
+        return result
+
+    def update(self, result: CheckResult) -> Optional[bool]:
+        return self._update(result.item_ids, result.vinted_ids, result.point_ids)
+
+    def _skip_checked(self, data_loader: PineconeDataLoader) -> PineconeDataLoader:
+        checked = self.journal.checked_ids(data_loader.vinted_ids)
+
+        if not checked:
+            return data_loader
+
+        return PineconeDataLoader(
+            [entry for entry in data_loader if entry.vinted_id not in checked]
+        )
+
+    async def commit_async(self, result: CheckResult) -> Optional[bool]:
+        if self.sold_buffer is None:
+            updated = await self.update_async(result)
+            await self._record(result, include_sold=bool(updated))
+
+            return updated
+
+        self.sold_buffer.add(result)
+        await self._record(
+            result, include_sold=self.sold_buffer.wal_path is not None
+        )
+
+        if self.sold_buffer.should_flush():
+            return await self.flush_async()
+
+        return None
+
+    async def _record(self, result: CheckResult, include_sold: bool) -> None:
+        if include_sold:
+            statuses = result.statuses
+        else:
+            statuses = [status for status in result.statuses if status.is_available]
+
+        if self.journal is not None:
+            self.journal.record(statuses)
+
+        if self.record_checks:
+            self._checks.extend(
+                ItemCheck(status.item_id, status.status_code)
+                for status in statuses
+                if status.ok
+            )
+
+            if len(self._checks) >= self.check_flush_size:
+                await self.flush_checks()
+
+    async def flush_checks(self) -> Optional[bool]:
+        if not self._checks:
+            return None
+
+        checks, self._checks = self._checks, []
+        inserted = await self.clients.bigquery.insert_checks(checks)
+
+        if not inserted:
+            self._checks = (checks + self._checks)[-CHECK_BUFFER_MAX_SIZE:]
+            logging.error(f"Check insert failed | Keeping {len(self._checks)} checks")
+
+        return inserted
+
+    async def close(self) -> None:
+        await self.flush_async()
+
+        if self.journal is not None:
+            self.journal.prune()
+            self.journal.close()
+
+        self.clients.close()
+
+    async def flush_async(self) -> Optional[bool]:
+        await self.flush_checks()
+
+        if self.sold_buffer is None or len(self.sold_buffer) == 0:
+            return None
+
+        try:
+            updated = await self.update_async(self.sold_buffer.pending())
+
+        except Exception as e:
+            logging.error(f"Sold buffer flush raised | {e}")
+            updated = False
+
+        if updated:
+            self.sold_buffer.clear()
+            return updated
+
+        delay = self.sold_buffer.defer()
+
+        if self.sold_buffer.should_alert:
+            logging.error(
+                f"Sold buffer flush failed {self.sold_buffer.n_flush_failures} times | "
+                f"Keeping {len(self.sold_buffer)} sold items in the WAL | "
+                f"Retrying in {delay:.0f}s"
+            )
+
+        return updated
+
+    async def update_async(self, result: CheckResult) -> Optional[bool]:
+        point_ids = {}
+
+        for namespace, namespace_point_ids in result.point_ids.items():
+            if len(namespace_point_ids) == 0:
+                namespace_point_ids = await self.clients.bigquery.query_point_ids(
+                    result.item_ids.get(namespace, [])
+                )
+
+                if not namespace_point_ids:
+                    return False
+
+            point_ids[namespace] = namespace_point_ids
+
+        if not point_ids:
+            return False
+
+        if self.clients.supabase is not None:
+            await asyncio.gather(
+                *[
+                    self.clients.supabase.set_items_unavailable(
+                        result.item_ids.get(namespace, [])
+                    )
+                    for namespace in point_ids
+                ]
+            )
+
+        delete_results = await self.clients.pinecone.delete_by_namespace(
+            point_ids=point_ids,
+            max_parallel=self.delete_parallelism,
+        )
+
+        n_points = sum(len(ids) for ids in point_ids.values())
+        n_failed = sum(len(failed) for _, failed in delete_results.values())
+        success_rate = 1 - n_failed / n_points
+
+        if success_rate > SUCCESS_RATE_THRESHOLD:
+            return await self.clients.bigquery.insert_rows_json(result.vinted_ids)
+
+        return False
 
     def _update(
         self,
@@ -1,11 +1,17 @@
-from typing import List, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from supabase import create_client, Client
 from .enums import SUPABASE_SAVED_TABLE_ID
 from .models import PineconeEntry
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 
 def init_supabase_client(url: str, key: str) -> Client:
+    from supabase import create_client
+
     return create_client(supabase_url=url, supabase_key=key)
 
 
@@ -16,27 +22,10 @@ def get_saved_items(
     ascending: bool = False,
 ) -> List[PineconeEntry]:
     try:
-        query = (
-            client.table(SUPABASE_SAVED_TABLE_ID)
-            .select("*")
-            .eq("is_available", True)
-            .order("created_at", desc=not ascending)
-        )
-
-        if n is not None:
-            start = int(index * n)
-            end = int(start + n - 1)
-            query = query.range(start, end)
-
+        query = saved_items_query(client, n=n, index=index, ascending=ascending)
         response = query.execute()
-        entries = []
 
-        for row in response.data:
-            row_data = row["metadata"]
-            entry = PineconeEntry.from_dict(row_data)
-            entries.append(entry)
-
-        return entries
+        return parse_saved_items(response)
 
     except Exception as e:
         print(e)
@@ -45,15 +34,57 @@ def get_saved_items(
 
 def set_items_unavailable(client: Client, item_ids: list[str]) -> bool:
     try:
-        response = (
-            client.table(SUPABASE_SAVED_TABLE_ID)
-            .update({"is_available": False})
-            .in_("item_id", item_ids)
-            .execute()
-        )
+        response = unavailable_query(client, item_ids).execute()
 
         return True
 
     except Exception as e:
         print(e)
         return False
+
+
+def saved_items_query(
+    client: Client,
+    n: Optional[int] = None,
+    index: Optional[int] = 0,
+    ascending: bool = False,
+    after: Optional[str] = None,
+) -> Any:
+    query = (
+        client.table(SUPABASE_SAVED_TABLE_ID)
+        .select("*")
+        .eq("is_available", True)
+        .order("created_at", desc=not ascending)
+    )
+
+    if after is not None:
+        if ascending:
+            query = query.gte("created_at", after)
+        else:
+            query = query.lte("created_at", after)
+
+        if n is not None:
+            query = query.limit(n)
+
+    elif n is not None:
+        start = int(index * n)
+        end = int(start + n - 1)
+        query = query.range(start, end)
+
+    return query
+
+
+def parse_saved_items(response: Any) -> List[PineconeEntry]:
+    return [PineconeEntry.from_dict(row["metadata"]) for row in response.data]
+
+
+def parse_saved_cursor(response: Any) -> Optional[str]:
+    return response.data[-1]["created_at"] if response.data else None
+
+
+def unavailable_query(client: Client, item_ids: list[str]) -> Any:
+    return (
+        client.table(SUPABASE_SAVED_TABLE_ID)
+        .update({"is_available": False})
+        .in_("item_id", item_ids)
+    )
@@ -0,0 +1,144 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import logging, queue
+import multiprocessing as mp
+from itertools import islice
+
+from .models import WorkerStats
+from .enums import SUPERVISOR_CHUNK_SIZE, SUPERVISOR_QUEUE_SIZE, SUPERVISOR_POLL_INTERVAL
+
+
+WorkerTarget = Callable[[int, Any, Any], None]
+StatsCallback = Callable[[int, WorkerStats], None]
+
+
+def iter_queue(task_queue: Any) -> Iterator[Dict]:
+    while True:
+        chunk = task_queue.get()
+
+        if chunk is None:
+            break
+
+        yield from chunk
+
+
+class Supervisor:
+    def __init__(
+        self,
+        target: WorkerTarget,
+        num_workers: int,
+        chunk_size: int = SUPERVISOR_CHUNK_SIZE,
+        queue_size: int = SUPERVISOR_QUEUE_SIZE,
+        poll_interval: float = SUPERVISOR_POLL_INTERVAL,
+        start_method: str = "spawn",
+        on_stats: Optional[StatsCallback] = None,
+    ):
+        self.target = target
+        self.num_workers = max(1, num_workers)
+        self.chunk_size = chunk_size
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.start_method = start_method
+        self.on_stats = on_stats
+        self.logger = logging.getLogger(__name__)
+        self.stats: Dict[int, WorkerStats] = {}
+
+    @property
+    def total(self) -> WorkerStats:
+        total = WorkerStats()
+
+        for stats in self.stats.values():
+            total.merge(stats)
+
+        return total
+
+    def run(self, rows: Iterable) -> WorkerStats:
+        context = mp.get_context(self.start_method)
+        task_queue = context.Queue(maxsize=self.queue_size)
+        stats_queue = context.Queue()
+
+        processes = [
+            context.Process(
+                target=self.target,
+                args=(worker_id, task_queue, stats_queue),
+                name=f"worker-{worker_id}",
+            )
+            for worker_id in range(self.num_workers)
+        ]
+
+        for process in processes:
+            process.start()
+
+        try:
+            for chunk in self._chunks(rows):
+                self._put(task_queue, chunk, stats_queue, processes)
+
+            for _ in processes:
+                self._put(task_queue, None, stats_queue, processes)
+
+            while any(process.is_alive() for process in processes):
+                self._drain(stats_queue, timeout=self.poll_interval)
+
+            self._drain(stats_queue)
+
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+                process.join()
+
+        for process in processes:
+            if process.exitcode:
+                self.logger.error(f"{process.name} exited with code {process.exitcode}")
+
+        return self.total
+
+    def _chunks(self, rows: Iterable) -> Iterator[List[Dict]]:
+        iterator = iter(rows)
+
+        while True:
+            chunk = [dict(row) for row in islice(iterator, self.chunk_size)]
+
+            if not chunk:
+                break
+
+            yield chunk
+
+    def _put(
+        self,
+        task_queue: Any,
+        item: Optional[List[Dict]],
+        stats_queue: Any,
+        processes: List[Any],
+    ) -> None:
+        while True:
+            if not any(process.is_alive() for process in processes):
+                raise RuntimeError("All workers exited before the queue was drained")
+
+            try:
+                task_queue.put(item, timeout=self.poll_interval)
+                break
+
+            except queue.Full:
+                pass
+
+            finally:
+                self._drain(stats_queue)
+
+    def _drain(self, stats_queue: Any, timeout: Optional[float] = None) -> None:
+        while True:
+            try:
+                if timeout:
+                    worker_id, stats = stats_queue.get(timeout=timeout)
+                    timeout = None
+                else:
+                    worker_id, stats = stats_queue.get_nowait()
+
+            except queue.Empty:
+                break
+
+            self.stats.setdefault(worker_id, WorkerStats()).merge(stats)
+
+            if self.on_stats is not None:
+                self.on_stats(worker_id, stats)
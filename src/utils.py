@@ -1,6 +1,6 @@
 from typing import Any, List
 
-import json, random, yaml
+import json, random
 from collections import Counter
 
 
@@ -13,7 +13,19 @@ def load_json(filepath: str) -> Any:
         return None
 
 
+def save_json(data: Any, filepath: str) -> bool:
+    try:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        return True
+    except Exception as e:
+        print(e)
+        return False
+
+
 def load_yaml(filepath: str) -> Any:
+    import yaml
+
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             return yaml.safe_load(f)
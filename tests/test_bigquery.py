@@ -0,0 +1,75 @@
+import pytest
+
+from src.bigquery import query_items, query_vector_ids, shard_predicate
+from src.enums import (
+    CHECK_TABLE_ID,
+    PRIORITY_CHECK_HALF_LIFE_HOURS,
+    PRIORITY_CHECK_LOOKBACK_HOURS,
+    PRIORITY_JITTER,
+)
+
+
+def test_stale_selection_skips_recent_checks_without_sorting():
+    query = query_items(n=100, stale_after_hours=24, sort_by_date=True)
+
+    assert CHECK_TABLE_ID in query
+    assert "INTERVAL 24 HOUR)) AS rc" in query
+    assert "rc.vinted_id IS NULL" in query
+    assert "MAX(checked_at)" not in query
+    assert "ORDER BY" not in query
+    assert query.rstrip().endswith("LIMIT 100")
+
+
+def test_prioritized_selection_bounds_the_check_lookback():
+    query = query_items(n=100, prioritize=True, stale_after_hours=24)
+
+    assert f"INTERVAL {PRIORITY_CHECK_LOOKBACK_HOURS} HOUR" in query
+    assert "rc.vinted_id IS NULL" in query
+    assert "ORDER BY priority" in query
+
+
+def test_default_selection_has_no_check_join():
+    query = query_items(n=100)
+
+    assert CHECK_TABLE_ID not in query
+    assert "ORDER BY RAND()" in query
+
+
+def test_shard_predicate_hashes_the_column():
+    assert shard_predicate("point_id", 1, 4) == (
+        "MOD(ABS(FARM_FINGERPRINT(CAST(point_id AS STRING))), 4) = 1"
+    )
+
+
+@pytest.mark.parametrize("shard, num_shards", [(0, None), (0, 0), (4, 4), (-1, 4)])
+def test_shard_predicate_rejects_invalid_shards(shard, num_shards):
+    with pytest.raises(ValueError):
+        shard_predicate("point_id", shard, num_shards)
+
+
+def test_selection_queries_filter_by_shard():
+    items = query_items(n=10, shard=2, num_shards=3)
+    vector_ids = query_vector_ids(n=10, shard=0, num_shards=3)
+
+    assert "AND MOD(ABS(FARM_FINGERPRINT(CAST(item.vinted_id AS STRING))), 3) = 2" in items
+    assert "AND MOD(ABS(FARM_FINGERPRINT(CAST(point_id AS STRING))), 3) = 0" in vector_ids
+    assert "FARM_FINGERPRINT" not in query_items(n=10)
+
+
+def test_priority_scores_sell_signals_and_check_recency():
+    query = query_items(n=100, prioritize=True)
+
+    assert query.lstrip().startswith("WITH")
+    assert "SoldRate AS" in query and "Interactions AS" in query
+    assert "CASE c.score WHEN 1 THEN 1.0 WHEN 2 THEN 0.6 WHEN 3 THEN 0.3" in query
+    assert f"lc.last_checked_at, HOUR) / {PRIORITY_CHECK_HALF_LIFE_HOURS}" in query
+    assert f"ORDER BY priority * (1 - {PRIORITY_JITTER} * RAND()) DESC" in query
+    assert "ORDER BY RAND()" not in query
+
+
+def test_priority_keeps_filters_before_the_order():
+    query = query_items(n=100, prioritize=True, catalog_score=2, is_women=True)
+
+    assert query.index("c.score = 2") < query.index("ORDER BY priority")
+    assert query.index("women = True") < query.index("ORDER BY priority")
+    assert query.rstrip().endswith("LIMIT 100")
@@ -0,0 +1,75 @@
+from src.buffer import SoldBuffer
+from src.models import CheckResult
+
+
+def sold_result(vinted_ids):
+    result = CheckResult()
+
+    for vinted_id in vinted_ids:
+        result.item_ids["top"].append(f"item_{vinted_id}")
+        result.point_ids["top"].append(f"point_{vinted_id}")
+        result.vinted_ids.append(vinted_id)
+
+    return result
+
+
+def test_replays_wal_after_crash(tmp_path):
+    wal_path = str(tmp_path / "sold.wal")
+
+    buffer = SoldBuffer(max_size=100, max_age=60, wal_path=wal_path)
+    buffer.add(sold_result(["1", "2"]))
+    buffer.add(sold_result(["3"]))
+    del buffer
+
+    replayed = SoldBuffer(max_size=100, max_age=60, wal_path=wal_path)
+
+    assert len(replayed) == 3
+    assert replayed.pending().vinted_ids == ["1", "2", "3"]
+    assert replayed.pending().point_ids["top"] == ["point_1", "point_2", "point_3"]
+    assert replayed.should_flush()
+
+
+def test_skips_corrupt_wal_lines(tmp_path):
+    wal_path = tmp_path / "sold.wal"
+
+    buffer = SoldBuffer(wal_path=str(wal_path))
+    buffer.add(sold_result(["1"]))
+
+    with open(wal_path, "a", encoding="utf-8") as f:
+        f.write('{"vinted_ids": ["2"')
+
+    assert SoldBuffer(wal_path=str(wal_path)).pending().vinted_ids == ["1"]
+
+
+def test_clear_truncates_wal(tmp_path):
+    wal_path = str(tmp_path / "sold.wal")
+
+    buffer = SoldBuffer(wal_path=wal_path)
+    buffer.add(sold_result(["1"]))
+    buffer.clear()
+
+    assert len(buffer) == 0
+    assert len(SoldBuffer(wal_path=wal_path)) == 0
+
+
+def test_defer_keeps_items_and_backs_off(tmp_path):
+    wal_path = str(tmp_path / "sold.wal")
+
+    buffer = SoldBuffer(
+        max_size=1,
+        wal_path=wal_path,
+        alert_after_failures=2,
+        retry_delay=10,
+        max_retry_delay=25,
+    )
+    buffer.add(sold_result(["1"]))
+
+    assert buffer.should_flush()
+    assert buffer.defer() == 10
+    assert not buffer.should_flush()
+    assert not buffer.should_alert
+    assert buffer.defer() == 20
+    assert buffer.defer() == 25
+    assert buffer.should_alert
+    assert len(buffer) == 1
+    assert len(SoldBuffer(wal_path=wal_path)) == 1
@@ -0,0 +1,106 @@
+import asyncio, json
+from contextlib import asynccontextmanager
+
+from src.checker import AsyncAvailabilityChecker
+from src.models import ProxyConfig, RecordedResponse
+
+
+BASE_URL = AsyncAvailabilityChecker.BASE_URL
+API_URL = AsyncAvailabilityChecker.BASE_API_URL
+
+
+class SequenceSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.requests = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    @asynccontextmanager
+    async def get(self, url, **kwargs):
+        if url == BASE_URL:
+            yield RecordedResponse(
+                method="GET",
+                url=url,
+                status=200,
+                cookie_values={"session": kwargs.get("proxy") or "direct"},
+            )
+            return
+
+        self.requests.append(kwargs)
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = json.dumps({"item": {"id": 1, "is_closed": False}})
+
+        yield RecordedResponse(method="GET", url=url, status=status, body=body)
+
+
+def checker(session, **kwargs):
+    checker = AsyncAvailabilityChecker(retry_base_delay=0, **kwargs)
+    checker.set_session(session)
+
+    return checker
+
+
+def test_retries_until_the_check_succeeds():
+    session = SequenceSession([429, 503])
+
+    status = asyncio.run(checker(session, max_attempts=3).run(["1"]))[0]
+
+    assert status.ok
+    assert status.is_available
+    assert status.attempts == 3
+    assert len(session.requests) == 3
+
+
+def test_returns_last_failure_after_max_attempts():
+    session = SequenceSession([429, 429, 429])
+
+    status = asyncio.run(checker(session, max_attempts=2).run(["1"]))[0]
+
+    assert status.status_code == 429
+    assert status.attempts == 2
+    assert len(session.requests) == 2
+
+
+def test_retry_switches_to_the_proxy():
+    session = SequenceSession([429])
+    proxy_config = ProxyConfig(password="pw")
+
+    status = asyncio.run(
+        checker(session, proxy_config=proxy_config, max_attempts=2).run(["1"])
+    )[0]
+
+    assert status.ok
+    assert "proxy" not in session.requests[0]
+    assert session.requests[1]["proxy"] == proxy_config.url
+    assert status.proxy == "default"
+
+
+def test_retry_delay_is_capped_and_jittered():
+    instance = AsyncAvailabilityChecker(retry_base_delay=1.0, retry_max_delay=4.0)
+
+    for attempt in range(1, 8):
+        delay = instance._retry_delay(attempt)
+        cap = min(4.0, 2 ** (attempt - 1))
+
+        assert cap / 2 <= delay <= cap
+
+
+def test_blocked_identity_is_retired_and_the_retry_uses_another():
+    session = SequenceSession([403])
+    instance = checker(
+        session, proxy_config=ProxyConfig(password="pw"), num_identities=2
+    )
+    instance.identity_pool.retire_after = 1
+
+    status = asyncio.run(instance.run(["1"]))[0]
+    blocked, retry = (request["cookies"]["session"] for request in session.requests)
+    retired = [x for x in instance.identity_pool.identities if not x.is_active]
+
+    assert status.ok
+    assert blocked != retry
+    assert len(retired) == 1
+    assert retired[0].generation == 1
+    assert retired[0].cookies is None
@@ -0,0 +1,45 @@
+import asyncio
+
+from src.clients import AsyncBigQuery, AsyncClients
+
+
+def test_query_point_ids_returns_empty_on_any_error(monkeypatch):
+    async def raise_error(self, query, to_list=True):
+        raise RuntimeError("bigquery down")
+
+    monkeypatch.setattr(AsyncBigQuery, "run_query", raise_error)
+    backend = AsyncBigQuery(None, None)
+
+    assert asyncio.run(backend.query_point_ids(["1"])) == []
+
+
+def test_shared_clients_reuse_the_executor_and_limits():
+    clients = AsyncClients()
+    shared = clients.share()
+
+    assert shared.executor is clients.executor
+    assert shared._semaphores is clients._semaphores
+
+    shared.close()
+
+    assert not clients.executor._shutdown
+
+    clients.close()
+
+    assert clients.executor._shutdown
+
+
+def test_selection_queries_run_without_a_timeout(monkeypatch):
+    timeouts = []
+
+    async def call_with_timeout(self, func, timeout, *args, **kwargs):
+        timeouts.append(timeout)
+        return [{"point_id": "p1"}]
+
+    monkeypatch.setattr(AsyncBigQuery, "call_with_timeout", call_with_timeout)
+    backend = AsyncBigQuery(None, None, timeout=60)
+
+    asyncio.run(backend.run_query("SELECT 1"))
+
+    assert asyncio.run(backend.query_point_ids(["1"])) == ["p1"]
+    assert timeouts == [None, 60]
@@ -0,0 +1,73 @@
+from src.checker import ProbeAvailabilityChecker
+from src.clients import AsyncClients
+from src.config import init_runner
+from src.models import Config, ScriptConfig
+
+
+SECRETS = {"APIFY_PROXY_PASSWORD": ["first", "second"]}
+
+
+def config():
+    return Config(
+        bq_client=None,
+        pinecone_index=None,
+        sort_by_date=False,
+        from_interactions=False,
+        from_saved=False,
+        is_women=True,
+        ascending_saved=False,
+    )
+
+
+def script_config(**kwargs):
+    return ScriptConfig(
+        secrets_path="secrets.json",
+        log_dir="logs",
+        use_proxy_alpha=1.0,
+        proxy_password_position=1,
+        num_items=10,
+        **kwargs,
+    )
+
+
+def test_init_runner_builds_from_script_config(tmp_path):
+    clients = AsyncClients()
+    runner = init_runner(
+        script_config(
+            probe_strategy="head",
+            etags_path=str(tmp_path / "etags.json"),
+            journal_path=str(tmp_path / "journal.sqlite"),
+            sold_buffer_max_size=10,
+            sold_buffer_wal_path=str(tmp_path / "sold.wal"),
+            use_proxy_pool=True,
+            proxy_types=["datacenter"],
+            num_identities=2,
+        ),
+        config(),
+        secrets=SECRETS,
+        clients=clients,
+        create_tables=False,
+    )
+
+    assert isinstance(runner.checker, ProbeAvailabilityChecker)
+    assert runner.checker.proxy_config.password == "second"
+    assert runner.checker.etags_path == str(tmp_path / "etags.json")
+    assert len(runner.checker.identity_pool.identities) == 2
+    assert runner.journal is not None
+    assert runner.sold_buffer.wal_path == str(tmp_path / "sold.wal")
+    assert runner.clients is clients
+
+    runner.journal.close()
+    clients.close()
+
+
+def test_init_runner_leaves_optional_parts_off(tmp_path):
+    runner = init_runner(
+        script_config(), config(), secrets=SECRETS, create_tables=False
+    )
+
+    assert runner.journal is None
+    assert runner.sold_buffer is None
+    assert runner.checker.proxy_pool is None
+
+    runner.clients.close()
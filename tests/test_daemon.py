@@ -0,0 +1,52 @@
+import asyncio
+
+from src.daemon import Daemon
+from src.models import ScheduledJob
+
+
+class FakeRunner:
+    def __init__(self):
+        self.config = None
+        self.n_flushes = 0
+
+    async def flush_async(self):
+        self.n_flushes += 1
+
+
+def test_stop_cancels_the_running_job():
+    async def run():
+        started = asyncio.Event()
+        cancelled = []
+
+        async def handler(runner):
+            started.set()
+
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        job = ScheduledJob(name="all", interval=3600)
+        runner = FakeRunner()
+        daemon = Daemon(
+            runners={"all": runner},
+            jobs=[job],
+            handlers={"all": handler},
+            config_factory=lambda name: name,
+        )
+
+        task = asyncio.ensure_future(daemon.run())
+        await asyncio.wait_for(started.wait(), 1)
+        daemon.stop()
+        await asyncio.wait_for(task, 1)
+
+        return job, runner, cancelled
+
+    job, runner, cancelled = asyncio.run(run())
+
+    assert cancelled == [True]
+    assert job.n_runs == 0
+    assert job.n_failures == 0
+    assert job.last_run_at is not None
+    assert runner.n_flushes == 1
@@ -0,0 +1,42 @@
+from src.dedup import SeenIds
+from src.models import PineconeDataLoader, PineconeEntry
+
+
+def entry(vinted_id):
+    return PineconeEntry(
+        id=f"item_{vinted_id}",
+        point_id=f"point_{vinted_id}",
+        vinted_id=vinted_id,
+        url=f"https://www.vinted.fr/items/{vinted_id}",
+    )
+
+
+def test_add_counts_duplicates():
+    seen = SeenIds()
+
+    assert seen.add("1")
+    assert seen.add("2")
+    assert not seen.add("1")
+    assert "1" in seen and "3" not in seen
+    assert (len(seen), seen.n_seen, seen.n_duplicates) == (2, 3, 1)
+
+
+def test_numeric_and_string_ids_are_the_same_item():
+    seen = SeenIds()
+    seen.add("42")
+
+    assert 42 in seen
+    assert not seen.add(42)
+    assert seen.add("abc")
+    assert "abc" in seen
+
+
+def test_filter_drops_ids_seen_in_earlier_batches():
+    seen = SeenIds()
+
+    first = seen.filter(PineconeDataLoader([entry("1"), entry("2"), entry("1")]))
+    second = seen.filter(PineconeDataLoader([entry("2"), entry("3")]))
+
+    assert first.vinted_ids == ("1", "2")
+    assert second.vinted_ids == ("3",)
+    assert seen.n_duplicates == 2
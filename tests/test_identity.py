@@ -0,0 +1,127 @@
+import time
+
+from src.identity import IdentityPool, session_id
+from src.models import ProxyConfig
+from src.proxy import ProxyPool
+
+
+def proxy_pool(**kwargs):
+    return ProxyPool.from_passwords(
+        ["pw"], proxy_types=["datacenter", "residential"], **kwargs
+    )
+
+
+def test_sessions_are_deterministic():
+    pools = [
+        IdentityPool.from_proxy_config(ProxyConfig(password="pw"), n=3)
+        for _ in range(2)
+    ]
+
+    assert [x.key for x in pools[0].identities] == [x.key for x in pools[1].identities]
+    assert pools[0].identities[2].proxy_config.session_id == session_id(
+        "availability", 2
+    )
+
+
+def test_initial_binding_never_pins_direct():
+    for _ in range(20):
+        pool = IdentityPool.from_proxy_config(
+            ProxyConfig(password="pw"), n=4, proxy_pool=proxy_pool()
+        )
+
+        assert all(identity.proxy_url for identity in pool.identities)
+        assert all(identity.endpoint.name != "direct" for identity in pool.identities)
+
+
+def test_retire_rotates_session_and_rekeys():
+    rekeyed = []
+    pool = IdentityPool.from_proxy_config(
+        ProxyConfig(password="pw"),
+        n=2,
+        retire_after=2,
+        on_rekey=lambda identity, old_key: rekeyed.append(old_key),
+    )
+    identity = pool.identities[0]
+    old_key = identity.key
+    identity.cookies = {"a": "b"}
+
+    for _ in range(2):
+        identity.in_flight += 1
+        pool.release(identity, 403)
+
+    assert not identity.is_active
+    assert identity.cookies is None
+    assert identity.generation == 1
+    assert identity.key != old_key
+    assert rekeyed == [old_key]
+
+
+def test_acquire_skips_retired_identities():
+    pool = IdentityPool.from_proxy_config(ProxyConfig(password="pw"), n=2)
+    pool.retire(pool.identities[0])
+
+    assert all(pool.acquire() is pool.identities[1] for _ in range(5))
+    assert pool.retry_in() == 0.0
+
+
+def test_retry_in_waits_for_first_identity_back():
+    pool = IdentityPool.from_proxy_config(
+        ProxyConfig(password="pw"), n=2, retire_for=60
+    )
+
+    for identity in pool.identities:
+        pool.retire(identity)
+
+    assert 0 < pool.retry_in() <= 60
+
+    pool.identities[1].retired_until = time.monotonic() - 1
+
+    assert pool.retry_in() == 0.0
+
+
+def test_acquire_can_require_a_proxied_identity():
+    pool = IdentityPool.from_proxy_config(
+        ProxyConfig(password="pw"), n=2, proxy_pool=proxy_pool()
+    )
+    direct = next(e for e in pool.proxy_pool.endpoints if e.name == "direct")
+    pool.bind(pool.identities[0], direct)
+
+    assert pool.identities[0].proxy_url is None
+    assert all(
+        pool.acquire(require_proxy=True) is pool.identities[1] for _ in range(5)
+    )
+
+
+def test_rebinds_after_rebind_every_requests():
+    rekeyed = []
+    pool = IdentityPool.from_proxy_config(
+        ProxyConfig(password="pw"),
+        n=1,
+        proxy_pool=proxy_pool(),
+        rebind_every=3,
+        on_rekey=lambda identity, old_key: rekeyed.append(old_key),
+    )
+
+    for _ in range(3):
+        pool.release(pool.acquire(), 200)
+
+    assert len(rekeyed) == 1
+    assert pool.identities[0].generation == 1
+    assert pool.identities[0].n_bound_requests == 0
+
+
+def test_rebinds_when_endpoint_degrades():
+    pool = IdentityPool.from_proxy_config(
+        ProxyConfig(password="pw"), n=1, proxy_pool=proxy_pool(exploration=0.0)
+    )
+    identity = pool.identities[0]
+    bad = identity.endpoint
+
+    for endpoint in pool.proxy_pool.endpoints:
+        for _ in range(20):
+            endpoint.record(ok=endpoint is not bad, latency=0.5, alpha=0.2)
+
+    pool.release(pool.acquire(), 200)
+
+    assert identity.endpoint is not bad
+    assert identity.generation == 1
@@ -0,0 +1,42 @@
+import time
+
+from src.journal import CheckJournal
+from src.models import VintedItemStatus
+
+
+def test_skips_recent_checks(tmp_path):
+    journal = CheckJournal(str(tmp_path / "journal.sqlite"), skip_window=60)
+    journal.record(
+        [
+            VintedItemStatus(item_id="1", status_code=200),
+            VintedItemStatus(item_id="2", status_code=404, is_available=False),
+            VintedItemStatus(item_id="3", status_code=429),
+        ]
+    )
+
+    assert journal.checked_ids(["1", "2", "3", "5"]) == {"1", "2"}
+
+
+def test_checks_expire_after_skip_window(tmp_path, monkeypatch):
+    journal = CheckJournal(str(tmp_path / "journal.sqlite"), skip_window=60)
+    now = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: now - 120)
+    journal.record([VintedItemStatus(item_id="1", status_code=200)])
+    monkeypatch.setattr(time, "time", lambda: now)
+    journal.record([VintedItemStatus(item_id="2", status_code=200)])
+
+    assert journal.checked_ids(["1", "2"]) == {"2"}
+
+    journal.prune()
+    count = journal.connection.execute("SELECT COUNT(*) FROM checks").fetchone()[0]
+
+    assert count == 1
+
+
+def test_checked_ids_batches_large_lookups(tmp_path):
+    journal = CheckJournal(str(tmp_path / "journal.sqlite"))
+    statuses = [VintedItemStatus(item_id=str(i), status_code=200) for i in range(2000)]
+    journal.record(statuses)
+
+    assert len(journal.checked_ids([str(i) for i in range(2500)])) == 2000
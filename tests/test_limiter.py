@@ -0,0 +1,64 @@
+import asyncio
+
+from src.limiter import AdaptiveLimiter
+
+
+def release_all(limiter, status_codes):
+    async def run():
+        for status_code in status_codes:
+            await limiter.acquire()
+            await limiter.release(status_code)
+
+    asyncio.run(run())
+
+
+def test_decreases_on_backoff():
+    limiter = AdaptiveLimiter(max_limit=16, initial_limit=16, cooldown=0)
+    release_all(limiter, [429])
+
+    assert limiter.window == 8
+
+    release_all(limiter, [403, 503])
+
+    assert limiter.window == 2
+
+
+def test_decrease_respects_cooldown_and_min_limit():
+    limiter = AdaptiveLimiter(max_limit=16, min_limit=4, initial_limit=16, cooldown=60)
+    release_all(limiter, [429, 429, 429])
+
+    assert limiter.window == 8
+
+    limiter = AdaptiveLimiter(max_limit=16, min_limit=4, initial_limit=16, cooldown=0)
+    release_all(limiter, [429] * 5)
+
+    assert limiter.window == 4
+
+
+def test_increases_on_success_up_to_max():
+    limiter = AdaptiveLimiter(max_limit=4, initial_limit=2)
+    release_all(limiter, [200, 404, 200])
+
+    assert limiter.window == 3
+
+    release_all(limiter, [200] * 50)
+
+    assert limiter.window == 4
+    assert limiter.stats["success_rate"] == 1.0
+
+
+def test_acquire_waits_for_a_free_slot():
+    async def run():
+        limiter = AdaptiveLimiter(max_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert not waiter.done()
+
+        await limiter.release(200)
+        await asyncio.wait_for(waiter, 1)
+
+        assert limiter.in_flight == 1
+
+    asyncio.run(run())
@@ -0,0 +1,48 @@
+import pytest
+
+from src.models import PineconeDataLoader, PineconeEntry
+
+
+def entry(vinted_id, category_type="top"):
+    return PineconeEntry(
+        id=f"item_{vinted_id}",
+        point_id=f"point_{vinted_id}",
+        vinted_id=vinted_id,
+        url=f"https://www.vinted.fr/items/{vinted_id}",
+        category_type=category_type,
+    )
+
+
+def test_views_follow_added_entries():
+    loader = PineconeDataLoader([entry("1"), entry("2", "dress")])
+
+    assert loader.vinted_ids == ("1", "2")
+    assert set(loader.by_namespace()) == {"top", "dress"}
+
+    loader.add(entry("3"))
+
+    assert loader.vinted_ids == ("1", "2", "3")
+    assert [e.vinted_id for e in loader.by_namespace()["top"]] == ["1", "3"]
+
+
+def test_entries_and_views_are_read_only():
+    loader = PineconeDataLoader([entry("1")])
+
+    with pytest.raises(AttributeError):
+        loader.entries.append(entry("2"))
+
+    with pytest.raises(TypeError):
+        loader.by_namespace()["dress"] = ()
+
+    with pytest.raises(AttributeError):
+        loader.entries = []
+
+    assert loader.vinted_ids == ("1",)
+
+
+def test_loader_copies_its_input():
+    entries = [entry("1")]
+    loader = PineconeDataLoader(entries)
+    entries.append(entry("2"))
+
+    assert len(loader) == 1
@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+
+import src.pinecone
+from src.pinecone import delete_points_by_namespace_async, iter_neighbors
+
+
+class FakeIndex:
+    def __init__(self, failing_namespaces=()):
+        self.queries, self.deletes = [], []
+        self.failing_namespaces = failing_namespaces
+
+    def delete(self, ids, namespace):
+        self.deletes.append((namespace, list(ids)))
+
+        if namespace in self.failing_namespaces:
+            raise RuntimeError("delete failed")
+
+        return {}
+
+    def query(self, **kwargs):
+        self.queries.append(kwargs)
+
+        if kwargs["id"] == "boom":
+            raise RuntimeError("query failed")
+
+        matches = [
+            SimpleNamespace(
+                id=f"{kwargs['id']}_{i}",
+                metadata={
+                    "id": f"item_{kwargs['id']}_{i}",
+                    "vinted_id": f"{kwargs['id']}{i}",
+                    "url": f"https://www.vinted.fr/items/{kwargs['id']}{i}",
+                    "category_type": kwargs["namespace"],
+                },
+            )
+            for i in range(kwargs["top_k"])
+        ]
+
+        return SimpleNamespace(matches=matches)
+
+
+class CountingCall:
+    def __init__(self):
+        self.in_flight, self.max_in_flight = 0, 0
+
+    async def __call__(self, fn, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+        return fn(**kwargs)
+
+
+async def collect(index, queries, call, **kwargs):
+    return [
+        loader
+        async for loader in iter_neighbors(index, queries, n=2, call=call, **kwargs)
+    ]
+
+
+def test_iter_neighbors_bounds_parallel_queries():
+    index, call = FakeIndex(), CountingCall()
+    queries = [(str(i), "top") for i in range(7)]
+
+    loaders = asyncio.run(collect(index, queries, call, max_parallel=3))
+
+    assert len(loaders) == 7
+    assert call.max_in_flight == 3
+    assert sorted(q["id"] for q in index.queries) == [str(i) for i in range(7)]
+    assert all(len(loader) == 2 for loader in loaders)
+
+
+def test_iter_neighbors_skips_missing_namespaces_and_failed_queries():
+    index, call = FakeIndex(), CountingCall()
+    queries = [("1", "top"), ("2", None), ("boom", "dress"), ("3", "dress")]
+
+    loaders = asyncio.run(collect(index, queries, call, days_lookback=7))
+
+    assert {loader.entries[0].category_type for loader in loaders} == {"top", "dress"}
+    assert "2" not in [q["id"] for q in index.queries]
+    assert all("filter" in q for q in index.queries)
+
+
+def test_deletes_run_per_namespace_and_report_failures(monkeypatch):
+    monkeypatch.setattr(src.pinecone, "MAX_SLEEP_TIME", 0)
+    monkeypatch.setattr(src.pinecone, "BATCH_SIZE", 2)
+    index, call = FakeIndex(failing_namespaces={"dress"}), CountingCall()
+    point_ids = {"top": ["1", "2", "3"], "dress": ["4"], "coat": ["5", "6"]}
+
+    results = asyncio.run(
+        delete_points_by_namespace_async(index, point_ids, max_parallel=2, call=call)
+    )
+
+    assert results == {
+        "top": (1.0, []),
+        "dress": (0.0, ["4"]),
+        "coat": (1.0, []),
+    }
+    assert call.max_in_flight == 2
+    assert ("top", ["3"]) in index.deletes
@@ -0,0 +1,69 @@
+import asyncio
+
+from src.buffer import SoldBuffer
+from src.pipeline import Pipeline, _batch_record_batches
+
+from .test_buffer import sold_result
+
+
+class FakeRecordBatch:
+    def __init__(self, ids):
+        self.ids = list(ids)
+
+    @property
+    def num_rows(self):
+        return len(self.ids)
+
+    def slice(self, offset=0, length=None):
+        stop = None if length is None else offset + length
+        return FakeRecordBatch(self.ids[offset:stop])
+
+    def to_pydict(self):
+        return {
+            "id": self.ids,
+            "point_id": [f"p{i}" for i in self.ids],
+            "vinted_id": [f"v{i}" for i in self.ids],
+            "url": [f"u{i}" for i in self.ids],
+            "category_type": ["women"] * len(self.ids),
+        }
+
+
+def test_batch_record_batches_rechunks_across_batches():
+    record_batches = [
+        FakeRecordBatch(range(0, 5)),
+        FakeRecordBatch(range(5, 6)),
+        FakeRecordBatch(range(6, 13)),
+    ]
+
+    loaders = list(_batch_record_batches(record_batches, 4))
+
+    assert [loader.total_rows for loader in loaders] == [4, 4, 4, 1]
+    assert [entry.id for loader in loaders for entry in loader.entries] == list(
+        range(13)
+    )
+    assert loaders[0].vinted_ids == ("v0", "v1", "v2", "v3")
+
+
+def test_batch_record_batches_handles_empty_input():
+    assert list(_batch_record_batches([], 4)) == []
+    assert list(_batch_record_batches([FakeRecordBatch([])], 4)) == []
+
+
+class RaisingRunner:
+    def __init__(self, sold_buffer):
+        self.sold_buffer = sold_buffer
+
+    async def flush_async(self):
+        raise RuntimeError("bigquery down")
+
+
+def test_flush_error_defers_instead_of_spinning():
+    sold_buffer = SoldBuffer(max_age=0)
+    sold_buffer.add(sold_result(["1"]))
+    pipeline = Pipeline(RaisingRunner(sold_buffer), batch_size=1)
+
+    assert pipeline._flush_timeout() == 0
+
+    asyncio.run(pipeline._flush())
+
+    assert pipeline._flush_timeout() > 0
@@ -0,0 +1,85 @@
+from src.models import ProxyEndpoint
+from src.proxy import ProxyPool
+
+
+def explored(name, n_success, latency, cost=0.0, n_requests=20, proxied=True):
+    endpoint = ProxyPool.from_passwords(["pw"], proxy_types=["datacenter"]).endpoints[1]
+    endpoint.name = name
+    endpoint.cost = cost
+    endpoint.n_requests = n_requests
+    endpoint.n_success = n_success
+    endpoint.latency = latency
+
+    if not proxied:
+        endpoint.proxy_config = None
+
+    return endpoint
+
+
+def test_from_passwords_builds_direct_and_typed_endpoints():
+    pool = ProxyPool.from_passwords(["a", "b"], proxy_types=["datacenter"])
+
+    assert [endpoint.name for endpoint in pool.endpoints] == [
+        "direct",
+        "datacenter_0",
+        "datacenter_1",
+    ]
+    assert pool.endpoints[0].url is None
+    assert pool.endpoints[1].proxy_config.password == "a"
+
+
+def test_score_rewards_success_and_penalises_latency_and_cost():
+    fast = explored("fast", n_success=20, latency=0.5)
+    slow = explored("slow", n_success=20, latency=2.0)
+    flaky = explored("flaky", n_success=5, latency=0.5)
+    costly = explored("costly", n_success=20, latency=0.5, cost=1.0)
+
+    assert fast.score > slow.score
+    assert fast.score > flaky.score
+    assert fast.score > costly.score
+
+
+def test_record_smooths_latency():
+    endpoint = ProxyEndpoint(name="direct")
+    endpoint.record(ok=True, latency=1.0, alpha=0.5)
+    endpoint.record(ok=False, latency=3.0, alpha=0.5)
+
+    assert endpoint.n_requests == 2
+    assert endpoint.n_success == 1
+    assert endpoint.latency == 2.0
+
+
+def test_select_explores_unsampled_endpoints_first():
+    good = explored("good", n_success=20, latency=0.1)
+    fresh = explored("fresh", n_success=0, latency=None, n_requests=0)
+    pool = ProxyPool([good, fresh], exploration=0.0)
+
+    assert pool.select() is fresh
+
+
+def test_select_exploits_best_score():
+    good = explored("good", n_success=20, latency=0.1)
+    bad = explored("bad", n_success=2, latency=1.0)
+    pool = ProxyPool([bad, good], exploration=0.0)
+
+    assert all(pool.select() is good for _ in range(20))
+
+
+def test_select_can_require_a_proxy():
+    direct = explored("direct", n_success=20, latency=0.01, proxied=False)
+    proxied = explored("proxied", n_success=10, latency=1.0)
+    pool = ProxyPool([direct, proxied], exploration=0.0)
+
+    assert pool.select() is direct
+    assert pool.select(require_proxy=True) is proxied
+
+
+def test_is_degraded_compares_with_best_explored_endpoint():
+    good = explored("good", n_success=20, latency=0.1)
+    bad = explored("bad", n_success=2, latency=1.0)
+    fresh = explored("fresh", n_success=0, latency=None, n_requests=0)
+    pool = ProxyPool([good, bad, fresh], exploration=0.0)
+
+    assert pool.is_degraded(bad)
+    assert not pool.is_degraded(good)
+    assert not pool.is_degraded(fresh)
@@ -0,0 +1,105 @@
+import asyncio, json
+
+from src.checker import ProbeAvailabilityChecker
+from src.models import RecordedResponse
+from src.replay import ReplaySession, benchmark, recorded_items
+
+
+BASE_URL = ProbeAvailabilityChecker.BASE_URL
+API_URL = ProbeAvailabilityChecker.BASE_API_URL
+
+
+def details(item_id, is_closed):
+    return RecordedResponse(
+        method="GET",
+        url=API_URL.format(item_id),
+        status=200,
+        body=json.dumps({"item": {"id": item_id, "is_closed": is_closed}}),
+    )
+
+
+RESPONSES = [
+    RecordedResponse(
+        method="GET", url=BASE_URL, status=200, cookie_values={"session": "1"}
+    ),
+    RecordedResponse(
+        method="HEAD",
+        url=f"{BASE_URL}/items/1-shirt",
+        status=200,
+        headers={"ETag": '"v1"'},
+    ),
+    details("1", False),
+    RecordedResponse(method="HEAD", url=f"{BASE_URL}/items/2-coat", status=404),
+    details("3", True),
+]
+
+
+def probe_checker(**kwargs):
+    return ProbeAvailabilityChecker(max_attempts=1, retry_with_proxy=False, **kwargs)
+
+
+def test_recorded_items_prefers_item_urls():
+    assert recorded_items(RESPONSES) == {
+        "1": f"{BASE_URL}/items/1-shirt",
+        "2": f"{BASE_URL}/items/2-coat",
+        "3": None,
+    }
+
+
+def test_probe_answers_from_etag_and_falls_back_otherwise():
+    stats, statuses = asyncio.run(
+        benchmark(probe_checker(), RESPONSES, recorded_items(RESPONSES))
+    )
+
+    assert [(s.item_id, s.is_available) for s in statuses] == [
+        ("1", True),
+        ("2", False),
+        ("3", False),
+    ]
+    assert all(status.ok for status in statuses)
+
+    assert stats["cold"]["n_probed"] == 2
+    assert stats["cold"]["n_answered"] == 1
+    assert stats["cold"]["n_fallback"] == 2
+    assert stats["warm"]["n_probed"] == 2
+    assert stats["warm"]["n_answered"] == 2
+    assert stats["warm"]["n_fallback"] == 1
+    assert stats["warm"]["n_requests"] < stats["cold"]["n_requests"]
+    assert stats["warm"]["n_misses"] == 0
+
+
+def test_benchmark_can_skip_the_warm_pass():
+    stats, _ = asyncio.run(
+        benchmark(probe_checker(), RESPONSES, recorded_items(RESPONSES), warm=False)
+    )
+
+    assert list(stats) == ["cold"]
+
+
+def test_etags_survive_a_restart(tmp_path):
+    etags_path = str(tmp_path / "etags.json")
+    items = recorded_items(RESPONSES)
+
+    async def run(checker):
+        checker.set_session(ReplaySession(RESPONSES))
+        await checker.run(list(items), urls=list(items.values()))
+        await checker.close()
+
+        return checker.probe_stats
+
+    asyncio.run(run(probe_checker(etags_path=etags_path)))
+    probe_stats = asyncio.run(run(probe_checker(etags_path=etags_path)))
+
+    assert probe_stats == {"probed": 2, "answered": 2, "fallback": 1}
+
+
+def test_closed_items_drop_their_etag():
+    responses = RESPONSES[:2] + [details("1", True)]
+    checker = probe_checker()
+    checker.seed_etags({"1": '"v0"'})
+    checker.set_session(ReplaySession(responses))
+
+    statuses = asyncio.run(checker.run(["1"], urls=[f"{BASE_URL}/items/1-shirt"]))
+
+    assert not statuses[0].is_available
+    assert "1" not in checker._etags
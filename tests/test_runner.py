@@ -0,0 +1,204 @@
+import asyncio
+
+from src.buffer import SoldBuffer
+from src.journal import CheckJournal
+from src.models import (
+    CheckResult,
+    Config,
+    PineconeDataLoader,
+    PineconeEntry,
+    VintedItemStatus,
+)
+from src.runner import Runner
+
+
+class FakeBigQuery:
+    def __init__(self):
+        self.sold = []
+        self.checks = []
+
+    async def query_point_ids(self, item_ids):
+        return [f"point_{item_id}" for item_id in item_ids]
+
+    async def insert_rows_json(self, item_ids):
+        self.sold.extend(item_ids)
+        return True
+
+    async def insert_checks(self, checks):
+        self.checks.extend(checks)
+        return True
+
+
+class FakePinecone:
+    def __init__(self):
+        self.deleted = {}
+
+    async def delete_by_namespace(self, point_ids, max_parallel):
+        for namespace, ids in point_ids.items():
+            self.deleted.setdefault(namespace, []).extend(ids)
+
+        return {namespace: (1.0, []) for namespace in point_ids}
+
+
+class FakeClients:
+    def __init__(self):
+        self.bigquery = FakeBigQuery()
+        self.pinecone = FakePinecone()
+        self.supabase = None
+
+    def bind(self, config):
+        return self
+
+    def close(self):
+        pass
+
+
+def config():
+    return Config(
+        bq_client=None,
+        pinecone_index=None,
+        sort_by_date=False,
+        from_interactions=False,
+        from_saved=False,
+        is_women=True,
+        ascending_saved=False,
+    )
+
+
+def runner(**kwargs):
+    return Runner(config=config(), checker=None, clients=FakeClients(), **kwargs)
+
+
+def checked(available, sold):
+    result = CheckResult()
+
+    for vinted_id in available:
+        result.statuses.append(VintedItemStatus(item_id=vinted_id, status_code=200))
+
+    for vinted_id in sold:
+        result.statuses.append(
+            VintedItemStatus(item_id=vinted_id, status_code=404, is_available=False)
+        )
+        result.item_ids["women"].append(f"item_{vinted_id}")
+        result.point_ids["women"].append(f"point_{vinted_id}")
+        result.vinted_ids.append(vinted_id)
+
+    result.n = result.n_success = len(result.statuses)
+
+    return result
+
+
+def test_buffered_sold_items_are_not_journaled_without_wal(tmp_path):
+    journal = CheckJournal(str(tmp_path / "journal.sqlite"))
+    runner_ = runner(sold_buffer=SoldBuffer(max_size=100), journal=journal)
+
+    asyncio.run(runner_.commit_async(checked(["1"], ["2"])))
+
+    assert journal.checked_ids(["1", "2"]) == {"1"}
+
+
+def test_buffered_sold_items_are_journaled_with_wal(tmp_path):
+    journal = CheckJournal(str(tmp_path / "journal.sqlite"))
+    sold_buffer = SoldBuffer(max_size=100, wal_path=str(tmp_path / "sold.wal"))
+    runner_ = runner(sold_buffer=sold_buffer, journal=journal)
+
+    asyncio.run(runner_.commit_async(checked(["1"], ["2"])))
+
+    assert journal.checked_ids(["1", "2"]) == {"1", "2"}
+
+
+class FailingPinecone(FakePinecone):
+    async def delete_by_namespace(self, point_ids, max_parallel):
+        raise RuntimeError("pinecone down")
+
+
+def test_raising_flush_defers_the_next_attempt():
+    sold_buffer = SoldBuffer(max_size=1)
+    runner_ = runner(sold_buffer=sold_buffer)
+    runner_.clients.pinecone = FailingPinecone()
+
+    updated = asyncio.run(runner_.commit_async(checked([], ["1"])))
+
+    assert updated is False
+    assert len(sold_buffer) == 1
+    assert sold_buffer.n_flush_failures == 1
+    assert not sold_buffer.should_flush()
+    assert sold_buffer.time_until_flush() > 0
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.unavailable = []
+
+    async def set_items_unavailable(self, item_ids):
+        self.unavailable.extend(item_ids)
+        return True
+
+
+def test_update_async_writes_every_sink():
+    runner_ = runner()
+    runner_.clients.supabase = FakeSupabase()
+
+    updated = asyncio.run(runner_.update_async(checked(["1"], ["2", "3"])))
+
+    assert updated is True
+    assert runner_.clients.supabase.unavailable == ["item_2", "item_3"]
+    assert runner_.clients.pinecone.deleted == {"women": ["point_2", "point_3"]}
+    assert runner_.clients.bigquery.sold == ["2", "3"]
+
+
+def test_update_async_looks_up_missing_point_ids():
+    result = checked([], ["2"])
+    result.point_ids["women"] = []
+    runner_ = runner()
+
+    assert asyncio.run(runner_.update_async(result)) is True
+    assert runner_.clients.pinecone.deleted == {"women": ["point_item_2"]}
+
+
+def test_update_async_skips_sold_insert_when_deletes_fail():
+    class PartialPinecone(FakePinecone):
+        async def delete_by_namespace(self, point_ids, max_parallel):
+            return {
+                namespace: (0.0, list(ids)) for namespace, ids in point_ids.items()
+            }
+
+    runner_ = runner()
+    runner_.clients.pinecone = PartialPinecone()
+
+    assert asyncio.run(runner_.update_async(checked([], ["2"]))) is False
+    assert runner_.clients.bigquery.sold == []
+
+
+class FakeChecker:
+    def __init__(self, sold):
+        self.sold = set(sold)
+
+    async def run(self, item_ids, use_proxy=False, urls=None):
+        return [
+            VintedItemStatus(
+                item_id=item_id,
+                status_code=404 if item_id in self.sold else 200,
+                is_available=item_id not in self.sold,
+            )
+            for item_id in item_ids
+        ]
+
+
+def test_check_async_groups_sold_items_by_namespace():
+    entries = [
+        PineconeEntry("item_1", "point_1", "1", "u1", "top"),
+        PineconeEntry("item_2", "point_2", "2", "u2", "dress"),
+        PineconeEntry("item_3", "point_3", "3", "u3", "top"),
+    ]
+    runner_ = Runner(
+        config=config(), checker=FakeChecker(["2", "3"]), clients=FakeClients()
+    )
+
+    result = asyncio.run(runner_.check_async(PineconeDataLoader(entries)))
+
+    assert result.n == 3
+    assert result.success_rate == 1.0
+    assert dict(result.item_ids) == {"top": ["item_3"], "dress": ["item_2"]}
+    assert dict(result.point_ids) == {"top": ["point_3"], "dress": ["point_2"]}
+    assert sorted(result.vinted_ids) == ["2", "3"]
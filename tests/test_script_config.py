@@ -0,0 +1,116 @@
+import pytest
+
+from src.models import ScriptConfig
+
+
+def script_config(**kwargs):
+    return ScriptConfig(
+        secrets_path="secrets.json",
+        log_dir="logs",
+        use_proxy_alpha=1.0,
+        proxy_password_position=0,
+        num_items=10,
+        **kwargs,
+    )
+
+
+def test_for_worker_isolates_local_state():
+    config = script_config(
+        cookie_cache_path="../cookies.json",
+        sold_buffer_wal_path="../sold_all.wal",
+        record_responses_path="../responses.jsonl",
+        etags_path="../etags.json",
+        journal_path="../journal_all.sqlite",
+    )
+
+    workers = [config.for_worker(worker_id) for worker_id in range(2)]
+
+    assert workers[0].cookie_cache_path == "../cookies_worker0.json"
+    assert workers[1].sold_buffer_wal_path == "../sold_all_worker1.wal"
+    assert workers[1].record_responses_path == "../responses_worker1.jsonl"
+    assert workers[0].etags_path == "../etags_worker0.json"
+    assert workers[0].session_prefix != workers[1].session_prefix
+
+    for field in (
+        "cookie_cache_path",
+        "sold_buffer_wal_path",
+        "record_responses_path",
+        "etags_path",
+    ):
+        assert getattr(workers[0], field) != getattr(workers[1], field)
+        assert getattr(workers[0], field) != getattr(config, field)
+
+
+def test_for_worker_shares_journal_and_keeps_unset_paths():
+    config = script_config(journal_path="../journal_all.sqlite")
+    worker = config.for_worker(3)
+
+    assert worker.journal_path == config.journal_path
+    assert worker.cookie_cache_path is None
+    assert worker.sold_buffer_wal_path is None
+
+
+def test_for_job_isolates_shared_paths():
+    config = script_config(cookie_cache_path="../cookies.json")
+
+    assert config.for_job("all").cookie_cache_path == "../cookies_all.json"
+    assert config.for_job("all").session_prefix != config.for_job("saved").session_prefix
+
+
+def config_dict(common=None, script=None):
+    return {
+        "COMMON": {
+            "SECRETS_PATH": "secrets.json",
+            "LOG_DIR": "logs",
+            "USE_PROXY_ALPHA": 0.5,
+            "PROXY_PASSWORD_POSITION": 1,
+            **(common or {}),
+        },
+        "ALL": {"NUM_ITEMS": 100, **(script or {})},
+    }
+
+
+def test_from_config_dict_prefers_script_over_common(monkeypatch):
+    monkeypatch.delenv("SHARD", raising=False)
+    config = ScriptConfig.from_config_dict(
+        config_dict(
+            common={"IDENTITY_STRATEGY": "least_loaded", "SHARD": 0, "USE_ARROW": False},
+            script={
+                "IDENTITY_STRATEGY": "round_robin",
+                "SHARD": 2,
+                "USE_PROXY_ALPHA": 0.1,
+                "USE_ARROW": True,
+            },
+        ),
+        "ALL",
+    )
+
+    assert config.identity_strategy == "round_robin"
+    assert config.shard == 2
+    assert config.use_proxy_alpha == 0.1
+    assert config.use_arrow is True
+
+
+def test_from_config_dict_falls_back_to_common_then_defaults(monkeypatch):
+    monkeypatch.delenv("NUM_SHARDS", raising=False)
+    config = ScriptConfig.from_config_dict(
+        config_dict(common={"JOURNAL_PATH": "../journal.sqlite", "NUM_SHARDS": 4}),
+        "ALL",
+    )
+
+    assert config.journal_path == "../journal.sqlite"
+    assert config.num_shards == 4
+    assert config.use_proxy_alpha == 0.5
+    assert config.identity_strategy == "least_loaded"
+    assert config.num_workers == 1
+
+
+def test_from_config_dict_requires_keys_in_either_section():
+    with pytest.raises(KeyError):
+        ScriptConfig.from_config_dict({"COMMON": {}, "ALL": {"NUM_ITEMS": 1}}, "ALL")
+
+    config = ScriptConfig.from_config_dict(
+        config_dict(common={"NUM_ITEMS": 5}, script={"NUM_ITEMS": 7}), "ALL"
+    )
+
+    assert config.num_items == 7
@@ -0,0 +1,47 @@
+from src.supabase import parse_saved_cursor, saved_items_query
+
+
+class FakeQuery:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+
+        return call
+
+
+class FakeClient:
+    def __init__(self):
+        self.query = FakeQuery()
+
+    def table(self, name):
+        return self.query
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+def test_saved_items_query_pages_by_created_at():
+    query = saved_items_query(FakeClient(), n=10, after="2026-01-01T00:00:00")
+
+    assert ("lte", ("created_at", "2026-01-01T00:00:00")) in query.calls
+    assert ("limit", (10,)) in query.calls
+    assert not any(name == "range" for name, _ in query.calls)
+
+
+def test_saved_items_query_keeps_offset_paging_without_cursor():
+    query = saved_items_query(FakeClient(), n=10, index=2, ascending=True)
+
+    assert ("range", (20, 29)) in query.calls
+
+
+def test_parse_saved_cursor_uses_last_row():
+    response = FakeResponse([{"created_at": "a"}, {"created_at": "b"}])
+
+    assert parse_saved_cursor(response) == "b"
+    assert parse_saved_cursor(FakeResponse([])) is None